@@ -24,6 +24,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.sync_operations.smart_sync import run_smart_sync
 from src.services.category_manager import category_manager
+from src.utils.sync_reporter import SyncReporter, sync_reporter
 
 
 def main():
@@ -35,9 +36,21 @@ def main():
                        help='Show what would be synced without making changes')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Enable verbose logging')
+    parser.add_argument('--report', metavar='PATH',
+                       help='Save a JSON sync report to PATH when the sync ends')
+    parser.add_argument('--compact-report', action='store_true',
+                       help='Write the --report file without indentation')
+    parser.add_argument('--jsonl', metavar='PATH',
+                       help='Append every sync record to a JSON Lines log at PATH as it happens')
     
     args = parser.parse_args()
     
+    if args.verbose:
+        sync_reporter.set_verbosity(SyncReporter.V_VERBOSE)
+    
+    if args.jsonl:
+        sync_reporter.open_jsonl(args.jsonl)
+    
     print("\n" + "="*70)
     print("🧠 Smart Google Tasks + Notion Sync")
     print("="*70 + "\n")
@@ -89,6 +102,11 @@ def main():
         print("   • Check if Notion database fields are properly configured")
         print("="*70 + "\n")
         sys.exit(1)
+    finally:
+        # Only write a report if the sync actually started
+        if args.report and sync_reporter.sync_start_time is not None:
+            sync_reporter.save_sync_report(args.report, compact=args.compact_report)
+        sync_reporter.close_jsonl()
 
 
 if __name__ == "__main__":
@@ -3,17 +3,62 @@ API connection handlers for Google Tasks and Notion
 """
 import os
 import pickle
+import httpx
 from notion_client import Client
 from googleapiclient.discovery import build
+from google.oauth2.credentials import Credentials
 
 from src.config.settings import *
 
+# HTTP/2 lets concurrent Notion requests share one TLS connection (needs the h2 package)
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# OAuth 2.0 scopes for Google Tasks
+SCOPES = ['https://www.googleapis.com/auth/tasks']
+
+# OAuth token storage (token.pkl is the pickled token written by older versions)
+TOKEN_FILE = PROJECT_LOCATION + 'token.json'
+LEGACY_TOKEN_FILE = PROJECT_LOCATION + 'token.pkl'
+
+
+def load_google_credentials():
+    """Load saved Google credentials, or None if there are none yet"""
+    # Docker creates a directory when a bind-mounted file doesn't exist on the host
+    if os.path.isdir(TOKEN_FILE):
+        raise Exception(f"{TOKEN_FILE} is a directory, not a token file. Remove it and "
+                        f"create an empty file instead (touch token.json), see DOCKER.md")
+    
+    # An empty token.json (created with touch) counts as no token yet
+    if os.path.isfile(TOKEN_FILE) and os.path.getsize(TOKEN_FILE) > 0:
+        return Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+    
+    # One-time migration: convert an old pickled token to token.json
+    if os.path.isfile(LEGACY_TOKEN_FILE):
+        with open(LEGACY_TOKEN_FILE, 'rb') as token:
+            creds = pickle.load(token)
+        save_google_credentials(creds)
+        print(f"Converted {LEGACY_TOKEN_FILE} to {TOKEN_FILE}\n")
+        return creds
+    
+    return None
+
+
+def save_google_credentials(creds):
+    """Save Google credentials for the next run"""
+    with open(TOKEN_FILE, 'w') as token:
+        token.write(creds.to_json())
+
 
 class APIConnections:
     """Handles API connections for Google Tasks and Notion"""
     
     def __init__(self):
         self.service = None
+        self.credentials = None
         self.notion = None
         self._setup_google_tasks()
         self._setup_notion()
@@ -21,8 +66,10 @@ class APIConnections:
     def _setup_google_tasks(self):
         """Set up the Google Tasks API connection"""
         try:
-            credentials = pickle.load(open(PROJECT_LOCATION + 'token.pkl', 'rb'))
-            self.service = build('tasks', 'v1', credentials=credentials)
+            credentials = load_google_credentials()
+            # Built once per process and shared; skip the discovery file-cache lookup
+            self.service = build('tasks', 'v1', credentials=credentials, cache_discovery=False)
+            self.credentials = credentials
             
             # Test the connection
             print("Verifying the Google Tasks API token...\n")
@@ -39,15 +86,8 @@ class APIConnections:
             from google.auth.transport.requests import Request
             from google_auth_oauthlib.flow import InstalledAppFlow
             
-            # OAuth 2.0 scopes for Google Tasks
-            SCOPES = ['https://www.googleapis.com/auth/tasks']
-            
-            creds = None
             # Load existing token if available
-            token_file = PROJECT_LOCATION + 'token.pkl'
-            if os.path.exists(token_file):
-                with open(token_file, 'rb') as token:
-                    creds = pickle.load(token)
+            creds = load_google_credentials()
             
             # If there are no valid credentials, let the user log in
             if not creds or not creds.valid:
@@ -59,10 +99,10 @@ class APIConnections:
                     creds = flow.run_local_server(port=0)
                 
                 # Save the credentials for the next run
-                with open(token_file, 'wb') as token:
-                    pickle.dump(creds, token)
+                save_google_credentials(creds)
             
-            self.service = build('tasks', 'v1', credentials=creds)
+            self.service = build('tasks', 'v1', credentials=creds, cache_discovery=False)
+            self.credentials = creds
             
             # Test the connection
             test_list = self.service.tasklists().get(tasklist=DEFAULT_LIST_ID).execute()
@@ -74,10 +114,13 @@ class APIConnections:
     
     def _setup_notion(self):
         """Set up the Notion API connection"""
-        self.notion = Client(auth=NOTION_TOKEN)
+        # One pooled HTTP client shared by every thread keeps connections alive
+        http_client = httpx.Client(http2=HTTP2_AVAILABLE)
+        self.notion = Client(auth=NOTION_TOKEN, client=http_client)
 
 
 # Global API connections instance
 api = APIConnections()
 service = api.service
+credentials = api.credentials
 notion = api.notion
\ No newline at end of file
@@ -8,6 +8,7 @@ import time
 from typing import List, Dict, Any
 
 from src.services.api_connections import service, notion
+from src.services.google_tasks_service import TASKS_PAGE_SIZE
 from src.config.settings import *
 
 
@@ -122,7 +123,7 @@ class BatchOperationsService:
             creates: List of create dictionaries containing task data
         
         Returns:
-            List of created task results
+            List of created task results, in the same order as creates
         """
         if not creates:
             return []
@@ -130,16 +131,18 @@ class BatchOperationsService:
         print(f"🚀 Batch creating {len(creates)} Google Tasks...")
         
         batch_request = service.new_batch_http_request()
-        create_results = []
+        create_results = [{'error': 'No response received'} for _ in creates]
         
         def add_create_result(request_id, response, exception):
             """Callback to handle batch response"""
+            # Place each result at its request's index so callers can zip with creates
+            index = int(request_id.split('_')[1])
             if exception:
                 print(f"❌ Batch create failed for request {request_id}: {exception}")
-                create_results.append({'error': str(exception), 'request_id': request_id})
+                create_results[index] = {'error': str(exception), 'request_id': request_id}
             else:
                 print(f"✅ Batch create successful for request {request_id}")
-                create_results.append(response)
+                create_results[index] = response
         
         # Add all creates to batch
         for i, create_data in enumerate(creates):
@@ -175,6 +178,85 @@ class BatchOperationsService:
         
         return create_results
     
+    def batch_list_tasks(self, list_ids: List[str], fields: str = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch tasks from multiple Google Tasks lists in a single batch request
+        
+        Args:
+            list_ids: Google Tasks list IDs to fetch
+            fields: optional partial-response mask (include 'deleted')
+        
+        Returns:
+            Dictionary mapping list ID to its (non-deleted) tasks
+        
+        Raises:
+            Exception if the batch or any list fails, so callers never see partial results
+        """
+        list_ids = list(list_ids)
+        if not list_ids:
+            return {}
+        
+        tasks_by_list = {list_id: [] for list_id in list_ids}
+        
+        # The page token is needed to follow pagination
+        if fields:
+            fields = fields + ',nextPageToken'
+        
+        # Lists still to fetch -> page token (None for the first page)
+        pending = dict.fromkeys(list_ids)
+        
+        # Each round batches one page per pending list; lists that return a
+        # nextPageToken (more than TASKS_PAGE_SIZE tasks) go into the next round
+        while pending:
+            batch_request = service.new_batch_http_request()
+            round_ids = list(pending)
+            next_pending = {}
+            failed_lists = {}
+            
+            def add_list_result(request_id, response, exception):
+                """Callback to handle batch response"""
+                list_id = round_ids[int(request_id.split('_')[1])]
+                if exception:
+                    print(f"❌ Batch list failed for list {list_id}: {exception}")
+                    failed_lists[list_id] = exception
+                    return
+                
+                tasks_by_list[list_id].extend(
+                    task for task in response.get('items', []) if not task.get('deleted', False)
+                )
+                if response.get('nextPageToken'):
+                    next_pending[list_id] = response['nextPageToken']
+            
+            # Add one tasks.list call per list to the batch
+            for i, list_id in enumerate(round_ids):
+                params = {
+                    'tasklist': list_id,
+                    'maxResults': TASKS_PAGE_SIZE,
+                    'showHidden': True,
+                    'showDeleted': False
+                }
+                if pending[list_id]:
+                    params['pageToken'] = pending[list_id]
+                if fields:
+                    params['fields'] = fields
+                
+                list_request = service.tasks().list(**params)
+                batch_request.add(list_request, callback=add_list_result, request_id=f"list_{i}")
+            
+            # Execute batch request
+            try:
+                batch_request.execute()
+            except Exception as e:
+                print(f"❌ Batch request failed: {e}")
+                raise
+            
+            if failed_lists:
+                raise Exception(f"Failed to fetch {len(failed_lists)} task list(s): {', '.join(failed_lists)}")
+            
+            pending = next_pending
+        
+        return tasks_by_list
+    
     def parallel_update_notion_pages(self, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Update multiple Notion pages in parallel (respecting rate limits)
@@ -378,6 +460,19 @@ class BatchOperationsService:
                     }
                 }
                 
+                # Include the date in the create call instead of a follow-up update
+                if task_data['date']:
+                    from src.utils.date_helpers import date_to_string
+                    from datetime import date
+                    
+                    if isinstance(task_data['date'], date):
+                        properties[NOTION_DATE] = {
+                            'date': {
+                                'start': date_to_string(task_data['date']),
+                                'end': None
+                            }
+                        }
+                
                 # Create page with icon
                 new_page = notion.pages.create(
                     parent={'database_id': NOTION_DATABASE_ID},
@@ -388,24 +483,6 @@ class BatchOperationsService:
                     properties=properties
                 )
                 
-                # Handle due date in separate update if needed
-                if task_data['date']:
-                    from src.utils.date_helpers import date_to_string
-                    from datetime import date
-                    
-                    if isinstance(task_data['date'], date):
-                        notion.pages.update(
-                            page_id=new_page['id'],
-                            properties={
-                                NOTION_DATE: {
-                                    'date': {
-                                        'start': date_to_string(task_data['date']),
-                                        'end': None
-                                    }
-                                }
-                            }
-                        )
-                
                 return new_page
                 
             except Exception as e:
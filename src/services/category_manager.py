@@ -14,10 +14,12 @@ class CategoryManager:
     def __init__(self):
         self.mapping_file = os.path.join(PROJECT_LOCATION, 'category_list_mapping.json')
         self.category_to_list_id = {}
+        self._mappings_snapshot = None
         self.load_mapping()
     
     def load_mapping(self):
         """Load category to list ID mapping from file"""
+        self._mappings_snapshot = None
         if os.path.exists(self.mapping_file):
             try:
                 with open(self.mapping_file, 'r') as f:
@@ -32,6 +34,8 @@ class CategoryManager:
     
     def save_mapping(self):
         """Save category to list ID mapping to file"""
+        # Every mapping change is persisted here, so drop the cached copy
+        self._mappings_snapshot = None
         try:
             with open(self.mapping_file, 'w') as f:
                 json.dump(self.category_to_list_id, f, indent=2)
@@ -148,8 +152,14 @@ class CategoryManager:
         return self.category_to_list_id.get(category)
     
     def get_all_mappings(self):
-        """Get all category to list ID mappings"""
-        return self.category_to_list_id.copy()
+        """Get all category to list ID mappings
+        
+        The copy is cached until the mapping is next loaded or saved; callers
+        must treat it as read-only.
+        """
+        if self._mappings_snapshot is None:
+            self._mappings_snapshot = self.category_to_list_id.copy()
+        return self._mappings_snapshot
     
     def refresh_mappings(self):
         """Refresh mappings by syncing with current Notion categories"""
@@ -2,10 +2,30 @@
 Google Tasks service for creating and updating tasks
 """
 from datetime import date, datetime
+import threading
+
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import build_http
 
 from src.config.settings import *
 from src.utils.date_helpers import datetime_to_string, date_to_string, add_timezone_for_notion
-from src.services.api_connections import service
+from src.services.api_connections import service, credentials
+
+
+# Largest page the Tasks API returns for tasks.list
+TASKS_PAGE_SIZE = 100
+
+# httplib2 connections are not thread-safe, so each thread gets its own
+# (build_http applies the client library's default socket timeout)
+_thread_local = threading.local()
+
+
+def _thread_http():
+    """Returns an authorized HTTP connection owned by the calling thread"""
+    http = getattr(_thread_local, 'http', None)
+    if http is None:
+        http = _thread_local.http = AuthorizedHttp(credentials, http=build_http())
+    return http
 
 
 class GoogleTasksService:
@@ -100,11 +120,17 @@ class GoogleTasksService:
             return {'status': 'deleted'}
 
     def get_tasks_from_list(self, gtasks_list_id, max_results=500, show_deleted=False, 
-                           due_min=None, due_max=None):
-        """Gets tasks from a specific Google Tasks list"""
+                           due_min=None, due_max=None, fields=None):
+        """Gets tasks from a specific Google Tasks list
+        
+        Follows pagination until max_results tasks are collected.
+        fields is an optional partial-response mask, e.g. 'items(id,title,deleted)'.
+        Include 'deleted' in it so deleted tasks can still be filtered out.
+        Safe to call from worker threads.
+        """
         params = {
             'tasklist': gtasks_list_id,
-            'maxResults': max_results,
+            'maxResults': min(max_results, TASKS_PAGE_SIZE),
             'showHidden': True,
             'showDeleted': show_deleted
         }
@@ -113,8 +139,24 @@ class GoogleTasksService:
             params['dueMin'] = due_min
         if due_max:
             params['dueMax'] = due_max
-            
-        result = service.tasks().list(**params).execute()
+        if fields:
+            # The page token is needed to follow pagination
+            params['fields'] = fields + ',nextPageToken'
+        
+        # The API returns at most 100 tasks per call, so follow nextPageToken
+        # until max_results tasks are collected or the list is exhausted
+        http = _thread_http()
+        result = service.tasks().list(**params).execute(http=http)
+        items = result.get('items', [])
+        page_token = result.pop('nextPageToken', None)
+        
+        while page_token and len(items) < max_results:
+            response = service.tasks().list(pageToken=page_token, **params).execute(http=http)
+            items.extend(response.get('items', []))
+            page_token = response.get('nextPageToken')
+        
+        if items:
+            result['items'] = items[:max_results]
         
         # Filter out tasks with deleted: true, unless explicitly requesting deleted tasks
         if not show_deleted and 'items' in result:
@@ -1,21 +1,73 @@
 """
 Notion service for creating and updating tasks
 """
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import wraps
+from threading import Lock
 
 from src.config.settings import *
-from src.utils.date_helpers import now_to_datetime_string, add_timezone_for_notion, date_to_string
+from src.utils.date_helpers import (
+    now_to_datetime_string, add_timezone_for_notion, date_to_string, add_week_to_date_string
+)
 from src.services.api_connections import notion
 
 
+# Cached {property name: property id} map, loaded from the database schema once
+_property_ids = {}
+
+
+class NotionRateLimiter:
+    """Thread-safe token bucket that paces requests to the Notion API"""
+    
+    def __init__(self, rate=2.7, capacity=3):
+        # Notion allows ~3 requests per second; stay slightly under to avoid 429/502s
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self.lock = Lock()
+    
+    def acquire(self):
+        """Block until a request token is available"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared limiter for every Notion call in the process
+notion_rate_limiter = NotionRateLimiter()
+
+
+def notion_rate_limited(func):
+    """Decorator that takes one rate limiter token before each call"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        notion_rate_limiter.acquire()
+        return func(*args, **kwargs)
+    return wrapper
+
+
 class NotionService:
     """Service for managing Notion operations"""
     
+    @notion_rate_limited
     def create_task(self, task_name, task_date, task_description, notion_list, 
                    gtasks_id, gtasks_list_id, gtasks_status):
         """Creates a new Notion task and returns the task"""
         notion_status = self._convert_gtasks_status_to_notion(gtasks_status)
 
+        # Date and Due Date are sent with the create call itself
         new_task = notion.pages.create(
             parent={'database_id': NOTION_DATABASE_ID},
             icon={
@@ -23,6 +75,7 @@ class NotionService:
                 'emoji': self._get_task_icon(notion_status, notion_list)
             },
             properties={
+                **self._date_properties(task_date, clear_if_missing=False),
                 NOTION_TASK_NAME: {
                     'title': [{'text': {'content': task_name}}]
                 },
@@ -49,38 +102,6 @@ class NotionService:
                 }
             }
         )
-        
-        # Handle date if present
-        if isinstance(task_date, date):
-            # Set the Date field
-            date_str = date_to_string(task_date)
-            
-            # Also calculate Due Date as Date + 1 week
-            from src.utils.date_helpers import add_week_to_date_string
-            due_date_str = add_week_to_date_string(date_str)
-            
-            properties_to_update = {
-                NOTION_DATE: {
-                    'date': {
-                        'start': date_str,
-                        'end': None
-                    }
-                }
-            }
-            
-            # Add Due Date if calculation succeeded
-            if due_date_str:
-                properties_to_update[NOTION_DUE_DATE] = {
-                    'date': {
-                        'start': due_date_str,
-                        'end': None
-                    }
-                }
-            
-            notion.pages.update(
-                page_id=new_task['id'],
-                properties=properties_to_update
-            )
 
         print(f'Adding this task to Notion: {task_name}\n')
         return new_task
@@ -95,13 +116,16 @@ class NotionService:
         print(f'Updating Notion task: {task_name}')
         print(f'  Status: {status_str}, Category: {notion_list}')
         
-        # Get current task info for change detection
+        # Get current task info for change detection (one limiter token per request)
+        notion_rate_limiter.acquire()
         current_page = notion.pages.retrieve(page_id=notion_page_id)
         current_category = current_page['properties'][NOTION_LIST_NAME]['select']['name'] if current_page['properties'][NOTION_LIST_NAME]['select'] else ''
         
         if current_category != notion_list:
             print(f'  📁 Category change: "{current_category}" → "{notion_list}"')
 
+        # Date and Due Date are set (or cleared) in the same request
+        notion_rate_limiter.acquire()
         updated_task = notion.pages.update(
             page_id=notion_page_id,
             icon={
@@ -109,6 +133,7 @@ class NotionService:
                 'emoji': self._get_task_icon(notion_status, notion_list)
             },
             properties={
+                **self._date_properties(task_date, clear_if_missing=True),
                 NOTION_TASK_NAME: {
                     'title': [{'text': {'content': task_name}}]
                 },
@@ -136,51 +161,11 @@ class NotionService:
             }
         )
 
-        # Handle date update
-        if isinstance(task_date, date):
-            # Set the Date field
-            date_str = date_to_string(task_date)
-            
-            # Also calculate Due Date as Date + 1 week
-            from src.utils.date_helpers import add_week_to_date_string
-            due_date_str = add_week_to_date_string(date_str)
-            
-            properties_to_update = {
-                NOTION_DATE: {
-                    'date': {
-                        'start': date_str,
-                        'end': None
-                    }
-                }
-            }
-            
-            # Add Due Date if calculation succeeded
-            if due_date_str:
-                properties_to_update[NOTION_DUE_DATE] = {
-                    'date': {
-                        'start': due_date_str,
-                        'end': None
-                    }
-                }
-            
-            notion.pages.update(
-                page_id=updated_task['id'],
-                properties=properties_to_update
-            )
-        else:
-            # Clear both Date and Due Date fields
-            notion.pages.update(
-                page_id=updated_task['id'],
-                properties={
-                    NOTION_DATE: {'date': None},
-                    NOTION_DUE_DATE: {'date': None}
-                }
-            )
-
         print(f'✅ Updated Notion task: {task_name}\n')
         return updated_task
 
 
+    @notion_rate_limited
     def update_sync_timestamp(self, page_id):
         """Update the last synced timestamp for a task"""
         return notion.pages.update(
@@ -195,22 +180,81 @@ class NotionService:
             }
         )
 
-    def query_database(self, filter_conditions, start_cursor=None):
-        """Query the Notion database with given filters"""
+    @notion_rate_limited
+    def query_database(self, filter_conditions, start_cursor=None, page_size=100,
+                       filter_properties=None):
+        """Query the Notion database with given filters
+        
+        filter_properties is an optional list of property names; only those
+        properties are returned for each page (sent as a query parameter,
+        which needs notion-client 2.1.0 or newer).
+        """
         query_params = {
             'database_id': NOTION_DATABASE_ID,
-            'filter': filter_conditions
+            'page_size': page_size  # Notion maximum, keeps pagination depth low
         }
         
+        # No filter conditions means every page in the database
+        if filter_conditions:
+            query_params['filter'] = filter_conditions
+        
         if start_cursor:
             query_params['start_cursor'] = start_cursor
+        
+        if filter_properties:
+            property_ids = self.get_property_ids(filter_properties)
+            if property_ids:
+                query_params['filter_properties'] = property_ids
             
         return notion.databases.query(**query_params)
 
+    def has_any(self, filter_conditions):
+        """Check whether any page matches the filters (fetches at most one page)"""
+        response = self.query_database(
+            filter_conditions, page_size=1, filter_properties=[NOTION_GTASKS_TASK_ID]
+        )
+        return bool(response['results'])
+
+    def iter_database(self, filter_conditions, filter_properties=None):
+        """Yield pages matching the filters, following pagination as it goes
+        
+        The next page is requested in the background as soon as its cursor is
+        known, so fetching overlaps with processing of the current page.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self.query_database, filter_conditions, None,
+                filter_properties=filter_properties
+            )
+            
+            while future is not None:
+                response = future.result()
+                future = None
+                
+                # Prefetch the next page before handing out the current one
+                if response['has_more'] and response['next_cursor']:
+                    future = executor.submit(
+                        self.query_database, filter_conditions, response['next_cursor'],
+                        filter_properties=filter_properties
+                    )
+                
+                yield from response['results']
+
+    def get_property_ids(self, property_names):
+        """Map property names to Notion property IDs (schema is fetched once)"""
+        if not _property_ids:
+            notion_rate_limiter.acquire()
+            database_response = notion.databases.retrieve(database_id=NOTION_DATABASE_ID)
+            for name, prop in database_response['properties'].items():
+                _property_ids[name] = prop['id']
+        
+        return [_property_ids[name] for name in property_names if name in _property_ids]
+
     def get_all_categories(self):
         """Get all unique categories from the Notion database"""
         try:
             # Get the database to extract select options from the Category field
+            notion_rate_limiter.acquire()
             database_response = notion.databases.retrieve(database_id=NOTION_DATABASE_ID)
             
             # Extract categories from the select field options
@@ -263,6 +307,7 @@ class NotionService:
         """Add a new category option to the Category select field in Notion database"""
         try:
             # Get current database properties
+            notion_rate_limiter.acquire()
             database_response = notion.databases.retrieve(database_id=NOTION_DATABASE_ID)
             
             # Get current category property
@@ -290,6 +335,7 @@ class NotionService:
             updated_options = current_options + [new_option]
             
             # Update database schema
+            notion_rate_limiter.acquire()
             update_response = notion.databases.update(
                 database_id=NOTION_DATABASE_ID,
                 properties={
@@ -329,6 +375,38 @@ class NotionService:
         
         return unmapped_lists
 
+    def _date_properties(self, task_date, clear_if_missing):
+        """Build Date and Due Date (Date + 1 week) properties for a task"""
+        if not isinstance(task_date, date):
+            if clear_if_missing:
+                return {
+                    NOTION_DATE: {'date': None},
+                    NOTION_DUE_DATE: {'date': None}
+                }
+            return {}
+        
+        date_str = date_to_string(task_date)
+        properties = {
+            NOTION_DATE: {
+                'date': {
+                    'start': date_str,
+                    'end': None
+                }
+            }
+        }
+        
+        # Add Due Date if calculation succeeded
+        due_date_str = add_week_to_date_string(date_str)
+        if due_date_str:
+            properties[NOTION_DUE_DATE] = {
+                'date': {
+                    'start': due_date_str,
+                    'end': None
+                }
+            }
+        
+        return properties
+
     def _convert_gtasks_status_to_notion(self, gtasks_status):
         """Convert Google Tasks status to Notion checkbox status"""
         if gtasks_status == GOOGLE_TO_DO_STATUS:
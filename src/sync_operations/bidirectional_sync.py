@@ -9,6 +9,7 @@ from src.utils.date_helpers import (
     add_timezone_for_notion, 
     datetime_to_string, 
     parse_datetime_string,
+    parse_notion_date,
     convert_timezone
 )
 from src.utils.notion_helpers import make_one_line_plain_text, make_description
@@ -549,8 +550,7 @@ class BidirectionalSyncManager:
         
         if changes:
             print(f"  🗘️ Updating Notion task: {task_data['name']}")
-            for change in changes:
-                print(f"    - {change}")
+            print("    - " + "\n    - ".join(changes))
             
             if not dry_run:
                 self.notion_service.update_task(
@@ -617,8 +617,7 @@ class BidirectionalSyncManager:
         
         if changes:
             print(f"  🗘️ Updating GTasks task: {task_data['name']}")
-            for change in changes:
-                print(f"    - {change}")
+            print("    - " + "\n    - ".join(changes))
             
             if not dry_run:
                 self.google_tasks_service.update_task(
@@ -802,19 +801,9 @@ class BidirectionalSyncManager:
         
         # Get date
         try:
-            task_date = parse_datetime_string(
-                page['properties'][NOTION_DATE]['date']['start'][:-6], 
-                '%Y-%m-%dT%H:%M:%S.000'
-            )
+            task_date = parse_notion_date(page['properties'][NOTION_DATE]['date'])
         except:
-            try:
-                from src.utils.date_helpers import parse_date_string
-                task_date = parse_date_string(
-                    page['properties'][NOTION_DATE]['date']['start'], 
-                    '%Y-%m-%d'
-                )
-            except:
-                task_date = ''
+            task_date = ''
         
         # Get description
         try:
@@ -22,18 +22,32 @@ def import_new_gtasks():
     
     print("Adding new Google Tasks to Notion...\n")
 
+    # Build the sync date window once for the per-list GTasks queries
+    use_date_window = PAST_WEEKS_TO_SYNC >= 0 or FUTURE_WEEKS_TO_SYNC >= 0
+    if use_date_window:
+        max_date = add_timezone_for_notion(
+            datetime_to_string(datetime.now() + timedelta(weeks=FUTURE_WEEKS_TO_SYNC))
+        )
+        min_date = add_timezone_for_notion(
+            datetime_to_string(datetime.now() - timedelta(weeks=PAST_WEEKS_TO_SYNC))
+        )
+
     # Get all Notion tasks that have GTasks IDs (to check for orphaned Google Tasks)
     query_filter = {
         'property': NOTION_GTASKS_TASK_ID, 
         'rich_text': {'is_not_empty': True}
     }
 
-    notion_pages = notion_service.query_database(query_filter)
+    # No date window here: every existing GTasks ID must be found, or a task whose
+    # due date just moved into the window would be imported again as a duplicate
+    notion_pages = notion_service.query_database(query_filter, page_size=100)
     
     # Handle pagination
     all_notion_results = notion_pages['results']
     while notion_pages['has_more']:
-        notion_pages = notion_service.query_database(query_filter, notion_pages['next_cursor'])
+        notion_pages = notion_service.query_database(
+            query_filter, notion_pages['next_cursor'], page_size=100
+        )
         all_notion_results.extend(notion_pages['results'])
         if not notion_pages['next_cursor']:
             break
@@ -55,15 +69,8 @@ def import_new_gtasks():
     
     for category_name, list_id in category_mappings.items():
         
-        # Build date filters
-        if PAST_WEEKS_TO_SYNC >= 0 or FUTURE_WEEKS_TO_SYNC >= 0:
-            max_date = add_timezone_for_notion(
-                datetime_to_string(datetime.now() + timedelta(weeks=FUTURE_WEEKS_TO_SYNC))
-            )
-            min_date = add_timezone_for_notion(
-                datetime_to_string(datetime.now() - timedelta(weeks=PAST_WEEKS_TO_SYNC))
-            )
-            
+        # Apply date filters
+        if use_date_window:
             if PAST_WEEKS_TO_SYNC >= 0 and FUTURE_WEEKS_TO_SYNC >= 0:
                 gtasks_results = google_tasks_service.get_tasks_from_list(
                     list_id, due_min=min_date, due_max=max_date
@@ -108,6 +115,9 @@ def import_new_gtasks():
     orphaned_task_indices = []
     truly_new_task_indices = []
     
+    # Compute the reference time once instead of per task
+    now = convert_timezone(datetime.now())
+    
     for i, task in enumerate(all_gtasks):
         task_id = task['id']
         if task_id not in gtasks_ids_in_notion:
@@ -116,11 +126,9 @@ def import_new_gtasks():
             # Simple heuristic: if task was created more than 1 day ago, it might be orphaned
             
             try:
-                from src.utils.date_helpers import parse_datetime_string, convert_timezone
                 task_created = convert_timezone(
                     parse_datetime_string(task['updated'][:-5], '%Y-%m-%dT%H:%M:%S')
                 )
-                now = convert_timezone(datetime.now())
                 
                 # If task is older than 1 day, it might be orphaned
                 if (now - task_created).days > 1:
@@ -1,6 +1,7 @@
 """
 Sync operations from Notion to Google Tasks
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from src.config.settings import *
@@ -8,14 +9,20 @@ from src.config.settings import *
 from src.utils.date_helpers import (
     add_timezone_for_notion, 
     datetime_to_string, 
-    parse_datetime_string, 
-    parse_date_string
+    parse_notion_date
 )
 from src.utils.notion_helpers import make_one_line_plain_text, make_description
 from src.services.category_manager import category_manager
 from src.services.batch_operations import batch_operations_service
+from src.services.notion_service import notion_rate_limited
 from src.utils.sync_reporter import sync_reporter
 
+# Number of orphaned Notion tasks to accumulate before each GTasks batch call
+GTASKS_CREATE_BATCH_SIZE = 50
+
+# Concurrent Notion page updates after GTasks creation
+NOTION_UPDATE_WORKERS = 5
+
 
 def import_new_notion_tasks():
     """Import new Notion tasks to Google Tasks using batch operations"""
@@ -74,90 +81,131 @@ def import_new_notion_tasks():
                 ]
             })
 
-    # Get all unsynced Notion tasks
-    notion_pages = notion_service.query_database(query_filter)
-    
-    # Handle pagination
-    all_results = notion_pages['results']
-    while notion_pages['has_more']:
-        notion_pages = notion_service.query_database(query_filter, notion_pages['next_cursor'])
-        all_results.extend(notion_pages['results'])
-        if not notion_pages['next_cursor']:
-            break
-
-    if len(all_results) == 0:
+    # Cheap existence check so the steady state (nothing to import) costs one tiny request
+    if not notion_service.has_any(query_filter):
         sync_reporter.log_substep("No orphaned tasks found", "All Notion tasks have GTasks IDs", "success")
         return
 
-    sync_reporter.log_substep(f"Found {len(all_results)} orphaned tasks", "Preparing batch creation", "warning")
+    # Only fetch the properties _extract_notion_task_data reads
+    filter_properties = [
+        NOTION_TASK_NAME, NOTION_STATUS, NOTION_DATE, NOTION_DESCRIPTION,
+        NOTION_LIST_NAME, NOTION_GTASKS_TASK_ID
+    ]
+
+    # Stream unsynced Notion tasks and create GTasks in batches as pages arrive
+    pending = []
+    total_found = 0
+    successful_creates = 0
+    failed_creates = 0
+    duration = 0.0
+    
+    # Category -> GTasks list ID resolved during this run
+    list_id_cache = {}
     
-    # Prepare batch create data
-    batch_creates = []
-    notion_page_data = []
+    # One Last Synced value for every page updated in this run
+    sync_timestamp = add_timezone_for_notion(datetime_to_string(datetime.now()))
     
-    for page in all_results:
-        task_data = _extract_notion_task_data(page)
+    for page in notion_service.iter_database(query_filter, filter_properties=filter_properties):
+        total_found += 1
+        task_data = _extract_notion_task_data(page, list_id_cache)
         
-        sync_reporter.log_substep(f"Processing: {task_data['name'][:40]}", 
-                                f"Category: {task_data['notion_list_name']}", "info")
+        # Skip building the per-page strings when info substeps are muted
+        if sync_reporter.is_enabled('info'):
+            sync_reporter.log_substep(f"Processing: {task_data['name'][:40]}", 
+                                    f"Category: {task_data['notion_list_name']}", "info")
         
-        # Store for later Notion updates
-        notion_page_data.append({
+        # One record per page: used for GTasks creation and the later Notion update
+        pending.append({
             'page_id': page['id'],
-            'task_data': task_data,
-            'task_name': task_data['name']
-        })
-        
-        # Prepare for batch GTasks creation
-        batch_creates.append({
             'task_data': task_data,
             'gtasks_list_id': task_data['gtasks_list_id']
         })
+        
+        # Flush periodically so GTasks creation overlaps with Notion pagination
+        if len(pending) >= GTASKS_CREATE_BATCH_SIZE:
+            succeeded, failed, elapsed = _create_gtasks_batch(pending, sync_timestamp)
+            successful_creates += succeeded
+            failed_creates += failed
+            duration += elapsed
+            pending = []
+    
+    if pending:
+        succeeded, failed, elapsed = _create_gtasks_batch(pending, sync_timestamp)
+        successful_creates += succeeded
+        failed_creates += failed
+        duration += elapsed
+
+    if total_found == 0:
+        sync_reporter.log_substep("No orphaned tasks found", "All Notion tasks have GTasks IDs", "success")
+        return
+
+    sync_reporter.log_substep(f"Found {total_found} orphaned tasks", "Batch creation finished", "warning")
+    
+    # Summary
+    if successful_creates > 0:
+        sync_reporter.log_substep(f"Successfully created {successful_creates} Google Tasks", 
+                                f"Completed in {duration:.1f}s", "success")
+    if failed_creates > 0:
+        sync_reporter.log_substep(f"Failed to create {failed_creates} Google Tasks", 
+                                "Check error details above", "error")
+
+
+def _create_gtasks_batch(pending, sync_timestamp):
+    """Create one batch of Google Tasks and write the new IDs back to Notion
     
-    # Execute batch Google Tasks creation
-    sync_reporter.log_batch_operation("GTasks Creation", len(batch_creates))
+    Returns a (successful, failed, duration_seconds) tuple.
+    """
+    # Execute batch Google Tasks creation (results come back in input order)
+    sync_reporter.log_batch_operation("GTasks Creation", len(pending))
     start_time = datetime.now()
-    gtasks_results = batch_operations_service.batch_create_gtasks(batch_creates)
+    gtasks_results = batch_operations_service.batch_create_gtasks(pending)
     duration = (datetime.now() - start_time).total_seconds()
     
-    # Process results and update Notion with GTasks IDs
+    # Process results and collect Notion updates for the created tasks
     successful_creates = 0
     failed_creates = 0
+    notion_updates = []
     
-    for i, result in enumerate(gtasks_results):
-        notion_data = notion_page_data[i]
-        
+    for record, result in zip(pending, gtasks_results):
         if 'error' not in result:
-            # Success - update Notion with GTasks ID
-            gtasks_id = result['id']
-            task_data = notion_data['task_data']
-            
-            _update_notion_after_gtasks_creation(
-                notion_data['page_id'], 
-                gtasks_id, 
-                task_data
+            successful_creates += 1
+            notion_updates.append((record, result['id']))
+        else:
+            failed_creates += 1
+            sync_reporter.record_error('gtasks_creation_failed', 
+                                     f"Failed to create GTasks for: {record['task_data']['name']}", 
+                                     {'error': result.get('error', 'Unknown error')})
+    
+    # Update Notion with GTasks IDs in parallel (paced by the Notion rate limiter)
+    with ThreadPoolExecutor(max_workers=NOTION_UPDATE_WORKERS) as executor:
+        futures = [
+            executor.submit(
+                _update_notion_after_gtasks_creation,
+                record['page_id'],
+                gtasks_id,
+                record['task_data'],
+                sync_timestamp
             )
+            for record, gtasks_id in notion_updates
+        ]
+        
+        for future, (record, gtasks_id) in zip(futures, notion_updates):
+            task_data = record['task_data']
+            try:
+                future.result()
+            except Exception as e:
+                sync_reporter.record_error('notion_update_failed', 
+                                         f"Failed to store GTasks ID in Notion for: {task_data['name']}", 
+                                         {'error': str(e)})
+                continue
             
-            successful_creates += 1
-            sync_reporter.record_notion_to_gtasks('created', notion_data['task_name'], {
+            sync_reporter.record_notion_to_gtasks('created', task_data['name'], {
                 'gtasks_id': gtasks_id,
                 'category': task_data['notion_list_name'],
                 'icon_updated': True
             })
-            
-        else:
-            failed_creates += 1
-            sync_reporter.record_error('gtasks_creation_failed', 
-                                     f"Failed to create GTasks for: {notion_data['task_name']}", 
-                                     {'error': result.get('error', 'Unknown error')})
     
-    # Summary
-    if successful_creates > 0:
-        sync_reporter.log_substep(f"Successfully created {successful_creates} Google Tasks", 
-                                f"Completed in {duration:.1f}s", "success")
-    if failed_creates > 0:
-        sync_reporter.log_substep(f"Failed to create {failed_creates} Google Tasks", 
-                                "Check error details above", "error")
+    return successful_creates, failed_creates, duration
 
 
 def update_gtasks_from_notion():
@@ -189,8 +237,11 @@ def update_gtasks_from_notion():
     return changes
 
 
-def _extract_notion_task_data(page):
-    """Extract task data from a Notion page"""
+def _extract_notion_task_data(page, list_id_cache=None):
+    """Extract task data from a Notion page
+    
+    list_id_cache is an optional dict of already resolved category -> list ID.
+    """
     # Get task name
     try:
         task_name = page['properties'][NOTION_TASK_NAME]['title'][0]['plain_text']
@@ -209,18 +260,9 @@ def _extract_notion_task_data(page):
 
     # Get date from the Date field (not Due Date)
     try:
-        task_date = parse_datetime_string(
-            page['properties'][NOTION_DATE]['date']['start'][:-6], 
-            '%Y-%m-%dT%H:%M:%S.000'
-        )
+        task_date = parse_notion_date(page['properties'][NOTION_DATE]['date'])
     except:
-        try:
-            task_date = parse_date_string(
-                page['properties'][NOTION_DATE]['date']['start'], 
-                '%Y-%m-%d'
-            )
-        except:
-            task_date = ''
+        task_date = ''
 
     # Get description
     try:
@@ -231,13 +273,20 @@ def _extract_notion_task_data(page):
     # Get list info using category manager with dynamic creation
     try:
         notion_list_name = page['properties'][NOTION_LIST_NAME]['select']['name']
-        # Use dynamic category creation - will create GTasks list if it doesn't exist
-        gtasks_list_id = category_manager.ensure_category_exists(notion_list_name, create_if_missing=True)
         
-        # If creation failed, use default
-        if not gtasks_list_id:
-            gtasks_list_id = DEFAULT_LIST_ID
-            print(f'⚠️ Failed to create/find GTasks list for category "{notion_list_name}", using default')
+        if list_id_cache is not None and notion_list_name in list_id_cache:
+            gtasks_list_id = list_id_cache[notion_list_name]
+        else:
+            # Use dynamic category creation - will create GTasks list if it doesn't exist
+            gtasks_list_id = category_manager.ensure_category_exists(notion_list_name, create_if_missing=True)
+            
+            # If creation failed, use default
+            if not gtasks_list_id:
+                gtasks_list_id = DEFAULT_LIST_ID
+                print(f'⚠️ Failed to create/find GTasks list for category "{notion_list_name}", using default')
+            
+            if list_id_cache is not None:
+                list_id_cache[notion_list_name] = gtasks_list_id
     except:
         gtasks_list_id = DEFAULT_LIST_ID
         notion_list_name = ''
@@ -252,7 +301,8 @@ def _extract_notion_task_data(page):
     }
 
 
-def _update_notion_after_gtasks_creation(page_id, gtasks_id, task_data):
+@notion_rate_limited
+def _update_notion_after_gtasks_creation(page_id, gtasks_id, task_data, sync_timestamp=None):
     """Update Notion task after Google Task creation with icon and set Due Date"""
     from src.services.api_connections import notion
     from src.services.notion_service import notion_service
@@ -271,7 +321,7 @@ def _update_notion_after_gtasks_creation(page_id, gtasks_id, task_data):
         },
         NOTION_LAST_SYNCED: {
             'date': {
-                'start': add_timezone_for_notion(
+                'start': sync_timestamp or add_timezone_for_notion(
                     datetime_to_string(datetime.now())
                 ),
                 'end': None
@@ -293,6 +343,12 @@ def _update_notion_after_gtasks_creation(page_id, gtasks_id, task_data):
         except Exception as e:
             print(f"Warning: Could not set due date for task {task_data['title']}: {e}")
     
+    # Set default list if empty (sent in the same request)
+    if task_data['notion_list_name'] == '':
+        properties[NOTION_LIST_NAME] = {
+            'select': {'name': DEFAULT_LIST_NAME}
+        }
+    
     notion.pages.update(
         page_id=page_id,
         icon={
@@ -300,15 +356,4 @@ def _update_notion_after_gtasks_creation(page_id, gtasks_id, task_data):
             'emoji': task_icon
         },
         properties=properties
-    )
-
-    # Set default list if empty
-    if task_data['notion_list_name'] == '':
-        notion.pages.update(
-            page_id=page_id,
-            properties={
-                NOTION_LIST_NAME: {
-                    'select': {'name': DEFAULT_LIST_NAME}
-                }
-            }
-        )
\ No newline at end of file
+    )
\ No newline at end of file
@@ -13,6 +13,24 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from src.config.settings import NOTION_TOKEN, NOTION_DATABASE_ID
 import requests
 
+# orjson encodes large property payloads much faster; fall back to the stdlib
+try:
+    import orjson
+
+    def _dumps(data):
+        return orjson.dumps(data)
+
+    def _loads(content):
+        return orjson.loads(content)
+except ImportError:
+    import json
+
+    def _dumps(data):
+        return json.dumps(data).encode('utf-8')
+
+    def _loads(content):
+        return json.loads(content)
+
 def add_database_properties():
     """Add required properties to the Notion database"""
     
@@ -33,56 +51,61 @@ def add_database_properties():
     print(f"Database ID: {NOTION_DATABASE_ID}")
     print()
     
-    # Get current database properties first
-    url = f"https://api.notion.com/v1/databases/{NOTION_DATABASE_ID}"
-    response = requests.get(url, headers=headers)
-    
-    if response.status_code != 200:
-        print(f"❌ Error getting database: {response.status_code}")
-        print(response.text)
-        return False
-    
-    current_properties = response.json().get("properties", {})
-    
-    # Check which properties already exist
-    existing_props = []
-    missing_props = {}
-    
-    for prop_name, prop_config in properties_to_add.items():
-        if prop_name in current_properties:
-            existing_props.append(prop_name)
-        else:
-            missing_props[prop_name] = prop_config
-    
-    if existing_props:
-        print("✅ Already exist:")
-        for prop in existing_props:
+    # One session keeps the TCP/TLS connection open for both requests
+    with requests.Session() as session:
+        session.headers.update(headers)
+        
+        # Get current database properties first
+        url = f"https://api.notion.com/v1/databases/{NOTION_DATABASE_ID}"
+        response = session.get(url)
+        
+        if response.status_code != 200:
+            print(f"❌ Error getting database: {response.status_code}")
+            print(response.text)
+            return False
+        
+        current_properties = _loads(response.content).get("properties", {})
+        
+        # Check which properties already exist
+        existing_props = []
+        missing_props = {}
+        
+        for prop_name, prop_config in properties_to_add.items():
+            if prop_name in current_properties:
+                existing_props.append(prop_name)
+            else:
+                missing_props[prop_name] = prop_config
+        
+        if existing_props:
+            print("✅ Already exist:")
+            for prop in existing_props:
+                print(f"   - {prop}")
+            print()
+        
+        if not missing_props:
+            print("🎉 All required properties already exist!")
+            return True
+        
+        print("➕ Adding missing properties:")
+        for prop in missing_props.keys():
             print(f"   - {prop}")
         print()
-    
-    if not missing_props:
-        print("🎉 All required properties already exist!")
-        return True
-    
-    print("➕ Adding missing properties:")
-    for prop in missing_props.keys():
-        print(f"   - {prop}")
-    print()
-    
-    # Update database with missing properties
-    update_data = {
-        "properties": {**current_properties, **missing_props}
-    }
-    
-    response = requests.patch(url, headers=headers, json=update_data)
-    
-    if response.status_code == 200:
-        print("🎉 Successfully added all missing properties!")
-        return True
-    else:
-        print(f"❌ Error updating database: {response.status_code}")
-        print(response.text)
-        return False
+        
+        # Update database with missing properties
+        update_data = {
+            "properties": {**current_properties, **missing_props}
+        }
+        
+        # Content-Type is already set on the session headers
+        response = session.patch(url, data=_dumps(update_data))
+        
+        if response.status_code == 200:
+            print("🎉 Successfully added all missing properties!")
+            return True
+        else:
+            print(f"❌ Error updating database: {response.status_code}")
+            print(response.text)
+            return False
 
 if __name__ == "__main__":
     if not NOTION_TOKEN:
@@ -8,6 +8,7 @@ This can happen when you delete Notion database pages directly instead of markin
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 # Add project root to path for imports
@@ -16,7 +17,16 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from src.services.category_manager import category_manager
 from src.services.notion_service import notion_service
 from src.services.google_tasks_service import google_tasks_service
-from src.utils.notion_helpers import make_one_line_plain_text
+from src.services.batch_operations import batch_operations_service
+from src.sync_operations.gtasks_to_notion import _extract_gtasks_data
+from src.utils.date_helpers import convert_timezone
+
+
+# Only the task fields needed for the orphan scan and re-import
+ORPHAN_SCAN_FIELDS = 'items(id,title,notes,status,due,updated,deleted)'
+
+# Concurrent Notion page creations when re-importing
+REIMPORT_WORKERS = 5
 
 
 def main():
@@ -58,7 +68,10 @@ def main():
 
 
 def find_orphaned_tasks():
-    """Find Google Tasks that don't have corresponding Notion pages"""
+    """Find Google Tasks that don't have corresponding Notion pages
+    
+    Returns None if the Google Tasks lists could not all be fetched.
+    """
     print("Scanning for orphaned Google Tasks...")
     
     # Get all synced Notion tasks
@@ -71,52 +84,58 @@ def find_orphaned_tasks():
         ]
     }
 
-    notion_pages = notion_service.query_database(query_filter)
-    
-    # Handle pagination
-    all_notion_results = notion_pages['results']
-    while notion_pages['has_more']:
-        notion_pages = notion_service.query_database(query_filter, notion_pages['next_cursor'])
-        all_notion_results.extend(notion_pages['results'])
-        if not notion_pages['next_cursor']:
-            break
+    # Only the GTasks ID is needed from each page
+    filter_properties = ['GTasks Task ID']
 
-    # Get existing Google Tasks IDs in Notion
-    gtasks_ids_in_notion = set()
-    for page in all_notion_results:
-        gtask_id = make_one_line_plain_text(page['properties']['GTasks Task ID']['rich_text'])
-        if gtask_id:
-            gtasks_ids_in_notion.add(gtask_id)
+    # Get existing Google Tasks IDs in Notion (pages are streamed, not accumulated)
+    # Pages with empty rich_text are skipped without building an empty string
+    gtasks_ids_in_notion = {
+        rich_text[0]['plain_text']
+        for page in notion_service.iter_database(query_filter, filter_properties=filter_properties)
+        if (rich_text := page['properties']['GTasks Task ID']['rich_text'])
+    }
 
     # Get all Google Tasks from mapped lists
     all_gtasks = []
     all_mappings = category_manager.get_all_mappings()
     
+    # Fetch every mapped list in one batched HTTP request; a partial result
+    # would make tasks look orphaned (or hide real orphans), so abort instead
+    try:
+        tasks_by_list = batch_operations_service.batch_list_tasks(
+            all_mappings.values(), fields=ORPHAN_SCAN_FIELDS
+        )
+    except Exception as e:
+        print(f"❌ Scan aborted, could not fetch Google Tasks: {e}")
+        return None
+    
     for category_name, list_id in all_mappings.items():
-        gtasks_results = google_tasks_service.get_tasks_from_list(list_id)
-        if 'items' in gtasks_results:
-            for task in gtasks_results['items']:
-                all_gtasks.append((task, category_name))
+        for task in tasks_by_list.get(list_id, []):
+            all_gtasks.append((task, category_name))
+
+    # Tasks updated before this cutoff (1 hour ago) are considered orphaned.
+    # The Tasks API has no updatedMax parameter, so this check stays client-side.
+    cutoff = convert_timezone(datetime.now()) - timedelta(hours=1)
+
+    # Tasks missing from Notion are the orphan candidates (set lookups only)
+    candidates = [
+        (task, category) for task, category in all_gtasks
+        if task['id'] not in gtasks_ids_in_notion
+    ]
 
     # Find orphaned tasks
     orphaned_tasks = []
-    for task, category in all_gtasks:
-        task_id = task['id']
-        if task_id not in gtasks_ids_in_notion:
-            # Check if it's actually orphaned (older than 1 hour)
-            try:
-                from src.utils.date_helpers import parse_datetime_string, convert_timezone
-                task_updated = convert_timezone(
-                    parse_datetime_string(task['updated'][:-5], '%Y-%m-%dT%H:%M:%S')
-                )
-                now = convert_timezone(datetime.now())
-                
-                # If task is older than 1 hour, consider it potentially orphaned
-                if (now - task_updated).total_seconds() > 3600:
-                    orphaned_tasks.append((task, category))
-            except:
-                # If we can't parse the date, include it
+    for task, category in candidates:
+        # Check if it's actually orphaned (older than 1 hour)
+        try:
+            # fromisoformat is implemented in C and much faster than strptime
+            task_updated = convert_timezone(datetime.fromisoformat(task['updated'][:-5]))
+            
+            if task_updated < cutoff:
                 orphaned_tasks.append((task, category))
+        except:
+            # If we can't parse the date, include it
+            orphaned_tasks.append((task, category))
 
     return orphaned_tasks
 
@@ -128,6 +147,8 @@ def scan_orphaned_tasks():
     print("-" * 50)
     
     orphaned_tasks = find_orphaned_tasks()
+    if orphaned_tasks is None:
+        return
     
     if not orphaned_tasks:
         print("✅ No orphaned Google Tasks found!")
@@ -154,6 +175,8 @@ def cleanup_orphaned_tasks():
     print("-" * 50)
     
     orphaned_tasks = find_orphaned_tasks()
+    if orphaned_tasks is None:
+        return
     
     if not orphaned_tasks:
         print("✅ No orphaned Google Tasks found!")
@@ -200,6 +223,8 @@ def reimport_orphaned_tasks():
     print("-" * 50)
     
     orphaned_tasks = find_orphaned_tasks()
+    if orphaned_tasks is None:
+        return
     
     if not orphaned_tasks:
         print("✅ No orphaned Google Tasks found!")
@@ -224,30 +249,42 @@ def reimport_orphaned_tasks():
     print("\nRe-importing orphaned Google Tasks to Notion...")
     imported_count = 0
     
-    from src.sync_operations.gtasks_to_notion import _extract_gtasks_data
+    # Resolve list IDs from one mapping snapshot
+    category_to_list_id = category_manager.get_all_mappings()
+    list_ids = [category_to_list_id.get(category) for task, category in orphaned_tasks]
     
-    for task, category in orphaned_tasks:
-        try:
-            list_id = category_manager.get_list_id_for_category(category)
-            task_data = _extract_gtasks_data(task, list_id)
-            
-            notion_service.create_task(
-                task_data['name'],
-                task_data['date'],
-                task_data['description'],
-                task_data['notion_list_name'],
-                task_data['gtasks_id'],
-                task_data['gtasks_list_id'],
-                task_data['gtasks_status']
-            )
-            
-            imported_count += 1
-            print(f"✅ Imported: {task.get('title', 'No title')}")
-        except Exception as e:
-            print(f"❌ Failed to import: {task.get('title', 'No title')} - {e}")
+    # Create pages concurrently; create_task is paced by the Notion rate limiter
+    with ThreadPoolExecutor(max_workers=REIMPORT_WORKERS) as executor:
+        results = executor.map(_reimport_task, [task for task, category in orphaned_tasks], list_ids)
+        
+        for (task, category), (success, error) in zip(orphaned_tasks, results):
+            if success:
+                imported_count += 1
+                print(f"✅ Imported: {task.get('title', 'No title')}")
+            else:
+                print(f"❌ Failed to import: {task.get('title', 'No title')} - {error}")
     
     print(f"\n✅ Re-imported {imported_count} orphaned Google Tasks to Notion")
 
 
+def _reimport_task(task, gtasks_list_id):
+    """Create a Notion page for one orphaned task, returns (success, error)"""
+    # Extraction is inside the try so one malformed task only fails itself
+    try:
+        task_data = _extract_gtasks_data(task, gtasks_list_id)
+        notion_service.create_task(
+            task_data['name'],
+            task_data['date'],
+            task_data['description'],
+            task_data['notion_list_name'],
+            task_data['gtasks_id'],
+            task_data['gtasks_list_id'],
+            task_data['gtasks_status']
+        )
+        return True, None
+    except Exception as e:
+        return False, e
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,30 +1,66 @@
 #!/usr/bin/env python3
 """
 Utility script to dump all Google Tasks data to JSON files
-Usage: python3 src/utilities/dump_google_tasks.py
+Usage: python3 src/utilities/dump_google_tasks.py [--split]
+
+The complete dump file is always written and is the authoritative copy;
+--split additionally writes one file per task list.
 """
 import json
-import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 import sys
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DUMP_DIR = PROJECT_ROOT / 'dump' / 'google_tasks'
+
 # Add project root to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.services.google_tasks_service import google_tasks_service
 from src.services.category_manager import category_manager
 
+# orjson serializes much faster than the stdlib encoder; fall back when missing
+try:
+    import orjson
+
+    def _dump_json(data, f, indent=False):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        f.write(orjson.dumps(data, option=option).decode('utf-8'))
+except ImportError:
+    def _dump_json(data, f, indent=False):
+        json.dump(data, f, indent=2 if indent else None, ensure_ascii=False)
+
+
+# Concurrent Google Tasks list fetches
+DUMP_FETCH_WORKERS = 8
+
+# 1 MiB write buffer; the JSON encoder emits many small chunks
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Characters not allowed in per-list file names (keeps word chars, spaces and dashes)
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\- ]')
+
 
 def create_dump_directory():
     """Create the dump directory structure"""
-    project_root = os.path.join(os.path.dirname(__file__), '..', '..')
-    dump_dir = os.path.join(project_root, 'dump', 'google_tasks')
-    os.makedirs(dump_dir, exist_ok=True)
-    return dump_dir
+    DUMP_DIR.mkdir(parents=True, exist_ok=True)
+    return DUMP_DIR
+
+
+def _fetch_list_tasks(task_list):
+    """Get tasks from one list (excluding deleted tasks by default)"""
+    return google_tasks_service.get_tasks_from_list(
+        task_list['id'], 
+        max_results=1000,  # Get more tasks
+        show_deleted=False  # Exclude deleted tasks (set to True if you need them)
+    )
 
 
-def dump_all_google_tasks():
-    """Dump all Google Tasks data to JSON files"""
+def dump_all_google_tasks(split=False):
+    """Dump all Google Tasks data to JSON files (per-list files only when split)"""
     print("🚀 Starting Google Tasks dump...")
     
     # Create dump directory
@@ -40,75 +76,84 @@ def dump_all_google_tasks():
     
     # Get category mappings for reference
     category_mappings = category_manager.get_all_mappings()
+    list_id_to_category = {list_id: name for name, list_id in category_mappings.items()}
     
-    # Prepare dump data
-    dump_data = {
-        'timestamp': datetime.now().isoformat(),
-        'total_lists': len(all_lists),
-        'category_mappings': category_mappings,
-        'lists': [],
-        'all_tasks': []
-    }
+    dump_filename = f"google_tasks_complete_{timestamp}.json"
+    dump_filepath = dump_dir / dump_filename
     
+    # Per-list summaries only; task data is written out as each list is processed
+    list_summaries = []
     total_tasks = 0
     
-    # Process each list
-    for task_list in all_lists:
-        list_id = task_list['id']
-        list_title = task_list['title']
-        
-        print(f"📂 Processing list: {list_title}")
-        
-        # Get tasks from this list (excluding deleted tasks by default)
-        tasks_data = google_tasks_service.get_tasks_from_list(
-            list_id, 
-            max_results=1000,  # Get more tasks
-            show_deleted=False  # Exclude deleted tasks (set to True if you need them)
-        )
-        
-        tasks = tasks_data.get('items', [])
-        total_tasks += len(tasks)
-        print(f"   📝 Found {len(tasks)} tasks")
-        
-        # Find category name for this list
-        category_name = None
-        for cat_name, mapped_list_id in category_mappings.items():
-            if mapped_list_id == list_id:
-                category_name = cat_name
-                break
-        
-        list_info = {
-            'list_id': list_id,
-            'list_title': list_title,
-            'category_name': category_name,
-            'task_count': len(tasks),
-            'tasks': tasks,
-            'list_metadata': task_list
-        }
+    # Stream the complete dump into a temp file (header first, then one list
+    # object at a time) and move it into place only once it is complete
+    tmp_filepath = dump_filepath.with_name(dump_filename + '.tmp')
+    try:
+        with open(tmp_filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write('{\n')
+            f.write(f'"timestamp": {json.dumps(datetime.now().isoformat())},\n')
+            f.write(f'"total_lists": {len(all_lists)},\n')
+            f.write('"category_mappings": ')
+            _dump_json(category_mappings, f)
+            f.write(',\n"lists": [\n')
+            
+            # Fetch lists concurrently; map() yields results in list order for the stream
+            with ThreadPoolExecutor(max_workers=DUMP_FETCH_WORKERS) as executor:
+                fetched = executor.map(_fetch_list_tasks, all_lists)
+                
+                # Process each list
+                for i, (task_list, tasks_data) in enumerate(zip(all_lists, fetched)):
+                    list_id = task_list['id']
+                    list_title = task_list['title']
+                    
+                    print(f"📂 Processing list: {list_title}")
+                    
+                    tasks = tasks_data.get('items', [])
+                    total_tasks += len(tasks)
+                    print(f"   📝 Found {len(tasks)} tasks")
+                    
+                    category_name = list_id_to_category.get(list_id)
+                    
+                    list_info = {
+                        'list_id': list_id,
+                        'list_title': list_title,
+                        'category_name': category_name,
+                        'task_count': len(tasks),
+                        'tasks': tasks,
+                        'list_metadata': task_list
+                    }
+                    
+                    if i:
+                        f.write(',\n')
+                    _dump_json(list_info, f)
+                    
+                    # Save individual list file
+                    if split:
+                        safe_title = _UNSAFE_FILENAME_CHARS.sub('', list_title).replace(' ', '_')
+                        list_filename = f"{safe_title}_{timestamp}.json"
+                        list_filepath = dump_dir / list_filename
+                        
+                        with open(list_filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as list_file:
+                            _dump_json(list_info, list_file, indent=True)
+                        
+                        print(f"   💾 List saved: {list_filename}")
+                    
+                    list_summaries.append({
+                        'list_title': list_title,
+                        'category_name': category_name,
+                        'task_count': len(tasks)
+                    })
+            
+            f.write('\n]\n}\n')
         
-        dump_data['lists'].append(list_info)
-        dump_data['all_tasks'].extend(tasks)
-    
-    # Save complete dump
-    dump_filename = f"google_tasks_complete_{timestamp}.json"
-    dump_filepath = os.path.join(dump_dir, dump_filename)
-    
-    with open(dump_filepath, 'w', encoding='utf-8') as f:
-        json.dump(dump_data, f, indent=2, ensure_ascii=False)
+        tmp_filepath.replace(dump_filepath)
+    except BaseException:
+        # Never leave a truncated dump behind
+        tmp_filepath.unlink(missing_ok=True)
+        raise
     
     print(f"💾 Complete dump saved: {dump_filename}")
     
-    # Save individual list files
-    for list_info in dump_data['lists']:
-        safe_title = "".join(c for c in list_info['list_title'] if c.isalnum() or c in (' ', '-', '_')).replace(' ', '_')
-        list_filename = f"{safe_title}_{timestamp}.json"
-        list_filepath = os.path.join(dump_dir, list_filename)
-        
-        with open(list_filepath, 'w', encoding='utf-8') as f:
-            json.dump(list_info, f, indent=2, ensure_ascii=False)
-        
-        print(f"   💾 List saved: {list_filename}")
-    
     # Print summary
     print("\n" + "="*60)
     print("📋 GOOGLE TASKS DUMP SUMMARY")
@@ -119,16 +164,24 @@ def dump_all_google_tasks():
     print(f"Timestamp: {timestamp}")
     
     print(f"\n📂 Lists breakdown:")
-    for lst in dump_data['lists']:
+    for lst in list_summaries:
         category_info = f" → {lst['category_name']}" if lst['category_name'] else " (unmapped)"
         print(f"   • {lst['list_title']}: {lst['task_count']} tasks{category_info}")
     
-    return dump_data, dump_dir
+    return dump_filepath, dump_dir
 
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Dump all Google Tasks data to JSON files')
+    parser.add_argument('--split', action='store_true',
+                       help='Also write one JSON file per task list')
+    
+    args = parser.parse_args()
+    
     try:
-        dump_data, dump_dir = dump_all_google_tasks()
+        dump_filepath, dump_dir = dump_all_google_tasks(split=args.split)
         print("\n✅ Google Tasks dump completed successfully!")
         print(f"🗂️  Files saved in: {dump_dir}")
         
@@ -4,11 +4,11 @@ Helper script to get your Google Tasks list IDs
 Run this after setting up OAuth credentials
 """
 
-import pickle
 import os
 from googleapiclient.discovery import build
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 
 SCOPES = ['https://www.googleapis.com/auth/tasks']
 
@@ -16,10 +16,9 @@ def get_gtasks_lists():
     """Get all Google Tasks lists with their IDs"""
     creds = None
     
-    # Check if token.pkl exists
-    if os.path.exists('token.pkl'):
-        with open('token.pkl', 'rb') as token:
-            creds = pickle.load(token)
+    # Check if token.json exists
+    if os.path.exists('token.json'):
+        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
     
     # If there are no (valid) credentials available, let the user log in
     if not creds or not creds.valid:
@@ -30,10 +29,10 @@ def get_gtasks_lists():
             creds = flow.run_local_server(port=0)
         
         # Save the credentials for the next run
-        with open('token.pkl', 'wb') as token:
-            pickle.dump(creds, token)
+        with open('token.json', 'w') as token:
+            token.write(creds.to_json())
 
-    service = build('tasks', 'v1', credentials=creds)
+    service = build('tasks', 'v1', credentials=creds, cache_discovery=False)
     
     # Get all task lists
     results = service.tasklists().list().execute()
@@ -4,14 +4,13 @@ Script to update icons for all existing Notion pages with the new icon system
 """
 import sys
 import os
-import time
-from concurrent.futures import ThreadPoolExecutor
-from threading import Semaphore
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
-from src.services.notion_service import notion_service
+from src.services.notion_service import notion_service, notion_rate_limited
 from src.services.api_connections import notion
 from src.config.settings import *
 
@@ -19,38 +18,26 @@ from src.config.settings import *
 class PageIconUpdater:
     """Updates icons for all existing Notion pages"""
     
-    def __init__(self):
-        # Rate limit: ~3 requests per second
-        self.rate_limit = Semaphore(3)
-        self.delay = 1.0  # 1 second between batches
+    def __init__(self, max_workers=8):
+        # Requests are paced by the shared Notion token bucket (~3 per second),
+        # workers only keep enough requests in flight to use the full rate
+        self.max_workers = max_workers
     
     def get_all_existing_pages(self):
         """Get all existing pages in the Notion database"""
         print("🔍 Fetching all existing Notion pages...")
         
         all_pages = []
-        has_more = True
-        next_cursor = None
         
-        while has_more:
-            # Use direct Notion API call without filters to get all pages
-            query_params = {
-                'database_id': NOTION_DATABASE_ID
-            }
-            
-            if next_cursor:
-                query_params['start_cursor'] = next_cursor
-            
-            response = notion.databases.query(**query_params)
-            
-            all_pages.extend(response['results'])
-            has_more = response['has_more']
-            next_cursor = response.get('next_cursor')
-            
-            print(f"  Retrieved {len(response['results'])} pages (total: {len(all_pages)})")
+        # Only the properties read by extract_page_data (the icon is always returned)
+        filter_properties = [NOTION_TASK_NAME, NOTION_STATUS, NOTION_LIST_NAME]
+        
+        # Unfiltered query, 100 pages per request with the next request prefetched
+        for page in notion_service.iter_database(None, filter_properties=filter_properties):
+            all_pages.append(page)
             
-            if not has_more or not next_cursor:
-                break
+            if len(all_pages) % 100 == 0:
+                print(f"  Retrieved {len(all_pages)} pages so far")
         
         print(f"✅ Found {len(all_pages)} total pages to update")
         return all_pages
@@ -76,59 +63,55 @@ class PageIconUpdater:
                 'task_name': task_name,
                 'notion_status': notion_status,
                 'notion_list': notion_list,
-                'current_icon': page.get('icon', {})
+                'current_icon': page.get('icon', {}),
+                # Icon this page should have, using the same logic as the service
+                'desired_icon': notion_service._get_task_icon(notion_status, notion_list)
             }
         except Exception as e:
             print(f"❌ Error extracting data from page: {e}")
             return None
     
+    def current_emoji(self, page_data):
+        """Get the page's current emoji icon, or None"""
+        current_icon = page_data['current_icon']
+        if current_icon and current_icon.get('type') == 'emoji':
+            return current_icon.get('emoji')
+        return None
+    
+    @notion_rate_limited
     def update_single_page_icon(self, page_data):
         """Update icon for a single page"""
-        with self.rate_limit:
-            try:
-                # Get appropriate icon using the same logic as the service
-                task_icon = notion_service._get_task_icon(
-                    page_data['notion_status'], 
-                    page_data['notion_list']
-                )
-                
-                # Check if icon needs updating
-                current_icon = page_data['current_icon']
-                current_emoji = None
-                if current_icon and current_icon.get('type') == 'emoji':
-                    current_emoji = current_icon.get('emoji')
-                
-                if current_emoji == task_icon:
-                    print(f"  ⏭️  Skipping '{page_data['task_name']}' - icon already correct ({task_icon})")
-                    return {'skipped': True, 'page_id': page_data['page_id']}
-                
-                # Update the page icon
-                notion.pages.update(
-                    page_id=page_data['page_id'],
-                    icon={
-                        'type': 'emoji',
-                        'emoji': task_icon
-                    }
-                )
-                
-                status = '✅' if page_data['notion_status'] else '⏳'
-                print(f"  {status} Updated '{page_data['task_name']}' → {task_icon} ({page_data['notion_list']})")
-                
-                return {
-                    'success': True, 
-                    'page_id': page_data['page_id'],
-                    'task_name': page_data['task_name'],
-                    'icon': task_icon,
-                    'old_icon': current_emoji
-                }
-                
-            except Exception as e:
-                print(f"  ❌ Failed to update '{page_data['task_name']}': {e}")
-                return {
-                    'error': str(e), 
-                    'page_id': page_data['page_id'],
-                    'task_name': page_data['task_name']
+        try:
+            task_icon = page_data['desired_icon']
+            current_emoji = self.current_emoji(page_data)
+            
+            # Update the page icon
+            notion.pages.update(
+                page_id=page_data['page_id'],
+                icon={
+                    'type': 'emoji',
+                    'emoji': task_icon
                 }
+            )
+            
+            status = '✅' if page_data['notion_status'] else '⏳'
+            print(f"  {status} Updated '{page_data['task_name']}' → {task_icon} ({page_data['notion_list']})")
+            
+            return {
+                'success': True, 
+                'page_id': page_data['page_id'],
+                'task_name': page_data['task_name'],
+                'icon': task_icon,
+                'old_icon': current_emoji
+            }
+            
+        except Exception as e:
+            print(f"  ❌ Failed to update '{page_data['task_name']}': {e}")
+            return {
+                'error': str(e), 
+                'page_id': page_data['page_id'],
+                'task_name': page_data['task_name']
+            }
     
     def update_all_page_icons(self, dry_run=False):
         """Update icons for all existing pages"""
@@ -154,17 +137,24 @@ class PageIconUpdater:
         
         # Show preview of changes
         print(f"\n🎨 Icon assignment preview:")
-        icon_counts = {}
-        for page_data in page_data_list:
-            task_icon = notion_service._get_task_icon(
-                page_data['notion_status'], 
-                page_data['notion_list']
-            )
-            icon_counts[task_icon] = icon_counts.get(task_icon, 0) + 1
+        icon_counts = Counter(page_data['desired_icon'] for page_data in page_data_list)
         
         for icon, count in sorted(icon_counts.items()):
             print(f"  {icon} → {count} pages")
         
+        # Drop pages whose icon is already correct before scheduling any updates
+        total_pages = len(page_data_list)
+        page_data_list = [
+            page_data for page_data in page_data_list
+            if page_data['desired_icon'] != self.current_emoji(page_data)
+        ]
+        skipped_updates = total_pages - len(page_data_list)
+        print(f"\n⏭️  {skipped_updates} pages already have the correct icon")
+        
+        if not page_data_list:
+            print("No page icons need updating")
+            return
+        
         if dry_run:
             print(f"\n🔍 DRY RUN COMPLETE - Would update {len(page_data_list)} pages")
             return
@@ -176,54 +166,35 @@ class PageIconUpdater:
             print("Operation cancelled")
             return
         
-        # Update icons in parallel batches
+        # Update icons in parallel
         print(f"\n🚀 Updating {len(page_data_list)} page icons...")
         
-        # Split into batches of 3 (rate limit)
-        batch_size = 3
-        batches = [page_data_list[i:i + batch_size] for i in range(0, len(page_data_list), batch_size)]
-        
         all_results = []
         successful_updates = 0
-        skipped_updates = 0
         failed_updates = 0
         
-        for batch_num, batch in enumerate(batches):
-            print(f"\n📦 Processing batch {batch_num + 1}/{len(batches)} ({len(batch)} pages)...")
+        # One pool for every page; the token bucket keeps requests at the rate limit
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.update_single_page_icon, page_data)
+                for page_data in page_data_list
+            ]
             
-            # Use ThreadPoolExecutor for parallel execution within batch
-            with ThreadPoolExecutor(max_workers=batch_size) as executor:
-                futures = []
-                
-                for page_data in batch:
-                    future = executor.submit(self.update_single_page_icon, page_data)
-                    futures.append(future)
-                
-                # Collect results
-                batch_results = []
-                for future in futures:
-                    try:
-                        result = future.result()
-                        batch_results.append(result)
-                        
-                        if result.get('success'):
-                            successful_updates += 1
-                        elif result.get('skipped'):
-                            skipped_updates += 1
-                        else:
-                            failed_updates += 1
-                            
-                    except Exception as e:
-                        print(f"  ❌ Batch operation failed: {e}")
-                        batch_results.append({'error': str(e)})
+            # Collect results as they complete
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                    all_results.append(result)
+                    
+                    if result.get('success'):
+                        successful_updates += 1
+                    else:
                         failed_updates += 1
-                
-                all_results.extend(batch_results)
-            
-            # Rate limit delay between batches
-            if batch_num < len(batches) - 1:
-                print(f"  ⏱️  Rate limit delay ({self.delay}s)...")
-                time.sleep(self.delay)
+                        
+                except Exception as e:
+                    print(f"  ❌ Icon update failed: {e}")
+                    all_results.append({'error': str(e)})
+                    failed_updates += 1
         
         # Summary
         print(f"\n" + "="*70)
@@ -231,7 +202,7 @@ class PageIconUpdater:
         print(f"✅ Successfully updated: {successful_updates} pages")
         print(f"⏭️  Skipped (already correct): {skipped_updates} pages")
         print(f"❌ Failed: {failed_updates} pages")
-        print(f"📊 Total processed: {len(page_data_list)} pages")
+        print(f"📊 Total processed: {total_pages} pages")
         print(f"=" * 70 + "\n")
         
         # Show any failures
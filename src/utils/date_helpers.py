@@ -1,8 +1,8 @@
 """
 Date and time utility functions
 """
-from datetime import date, datetime, timedelta
-from pytz import timezone, utc
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 from src.config.settings import TIMEZONE, TIMEZONE_OFFSET_FROM_GMT
 
@@ -34,32 +34,40 @@ def parse_date_string(date_string, format_str):
     return datetime.strptime(date_string, format_str)
 
 
+def parse_notion_date(notion_date):
+    """Returns the start of a Notion date property as a datetime, or '' if unset"""
+    date_start = (notion_date or {}).get('start')
+    if not date_start:
+        return ''
+    if 'T' in date_start:
+        # Datetime with UTC offset, e.g. 2025-09-19T10:00:00.000+05:30
+        return parse_datetime_string(date_start[:-6], '%Y-%m-%dT%H:%M:%S.000')
+    return parse_date_string(date_start, '%Y-%m-%d')
+
+
 def add_timezone_for_notion(datetime_string):
     """Adds timezone indicator to dateTimeString"""
     return datetime_string + TIMEZONE_OFFSET_FROM_GMT
 
 
-def convert_timezone(date_time, new_timezone=TIMEZONE):
-    """Convert dateTime from UTC to newTimeZone"""
-    return utc.localize(date_time).astimezone(timezone(new_timezone)).replace(tzinfo=None)
+# Configured timezone, resolved once at import (ZoneInfo also caches by key)
+_DEFAULT_TZ = ZoneInfo(TIMEZONE)
+
+
+def convert_timezone(date_time, new_timezone=None):
+    """Convert dateTime from UTC to newTimeZone (defaults to the configured timezone)"""
+    tz = _DEFAULT_TZ if new_timezone is None else ZoneInfo(new_timezone)
+    return date_time.replace(tzinfo=timezone.utc).astimezone(tz).replace(tzinfo=None)
 
 
 def add_week_to_date_string(date_string):
     """Add one week to a date string and return as date string"""
+    # Both YYYY-MM-DD and full datetime strings start with the date part
     try:
-        # Try parsing as datetime first
-        if 'T' in date_string:
-            dt = parse_datetime_string(date_string.split('T')[0] + 'T00:00:00', '%Y-%m-%dT%H:%M:%S')
-        else:
-            # Parse as date only
-            dt = parse_date_string(date_string, '%Y-%m-%d')
-        
-        # Add one week
-        new_date = dt + timedelta(weeks=1)
-        
-        # Return as date string (YYYY-MM-DD format)
-        return date_to_string(new_date.date() if hasattr(new_date, 'date') else new_date)
-        
-    except Exception as e:
+        new_date = date.fromisoformat(date_string[:10]) + timedelta(weeks=1)
+    except (TypeError, ValueError) as e:
         print(f"Error parsing date string '{date_string}': {e}")
-        return None
\ No newline at end of file
+        return None
+    
+    # Return as date string (YYYY-MM-DD format)
+    return new_date.isoformat()
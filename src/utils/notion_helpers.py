@@ -11,10 +11,7 @@ def make_notion_page_url(page_id, url_root):
 
 def make_description(rich_text):
     """Returns a plain text description from Notion's rich text field"""
-    description = ""
-    for item in rich_text:
-        description += item['text']['content']
-    return description
+    return ''.join(item['text']['content'] for item in rich_text)
 
 
 def make_one_line_plain_text(rich_text):
@@ -1,64 +1,226 @@
 """
 Enhanced sync reporting and logging utilities
 """
+from collections import deque
 from datetime import datetime
+from itertools import chain, islice
 from typing import Dict, List, Any
+import heapq
 import json
+import os
+import sys
+import time
+
+
+# Fixed banner and box-drawing strings
+_EQ80 = "═" * 80
+_DASH50 = "─" * 50
+_DASH60 = "─" * 60
+_TOP_BORDER = "╔" + "═" * 78 + "╗"
+_BOTTOM_BORDER = "╚" + "═" * 78 + "╝"
+_START_TITLE_LINE = "║" + " " * 20 + "🚀 ENHANCED GTASKS-NOTION SYNC STARTED" + " " * 18 + "║"
+_SUMMARY_TITLE_LINE = "║" + " " * 25 + "📊 SYNC COMPLETION SUMMARY" + " " * 25 + "║"
+
+# end_sync status lines
+_STATUS_OK = "✅ COMPLETED SUCCESSFULLY"
+_STATUS_ERR = "❌ COMPLETED WITH ERRORS"
+
+# Substep status -> icon
+_STATUS_ICONS = {
+    'info': 'ℹ️',
+    'success': '✅',
+    'warning': '⚠️',
+    'error': '❌',
+    'processing': '🔄'
+}
+_DEFAULT_STATUS_ICON = 'ℹ️'
+
+# Breakdown row labels for the usual actions (other actions are formatted on the fly)
+_N2G_TYPE = {a: f"Notion→GTasks ({a})" for a in ('created', 'updated', 'failed')}
+_G2N_TYPE = {a: f"GTasks→Notion ({a})" for a in ('created', 'updated', 'failed')}
+_BID_N2G_TYPE = "Bidirectional (Notion→GTasks)"
+_BID_G2N_TYPE = "Bidirectional (GTasks→Notion)"
+
+# Records kept per summary section (counters always cover the whole run)
+HISTORY_LIMIT = 50
+
+
+def _new_direction_section(maxlen=None):
+    """One-way sync section; records are stored column-wise (entry i of each deque)"""
+    return {
+        'created': 0,
+        'updated': 0,
+        'failed': 0,
+        'actions': deque(maxlen=maxlen),
+        'task_names': deque(maxlen=maxlen),
+        'details': deque(maxlen=maxlen),
+        'timestamps': deque(maxlen=maxlen)
+    }
+
+
+def _new_bidirectional_section(maxlen=None):
+    """Bidirectional sync section; records are stored column-wise"""
+    return {
+        'notion_newer': 0,
+        'gtasks_newer': 0,
+        'conflicts': 0,
+        'no_change': 0,
+        'actions': deque(maxlen=maxlen),
+        'task_names': deque(maxlen=maxlen),
+        'comparisons': deque(maxlen=maxlen),
+        'changes': deque(maxlen=maxlen),
+        'timestamps': deque(maxlen=maxlen)
+    }
+
+
+def _new_categories_section(maxlen=None):
+    """Category sync section"""
+    return {
+        'synced': 0,
+        'created_notion': 0,
+        'created_gtasks': 0,
+        'mappings': {}
+    }
+
+
+def _new_icons_section(maxlen=None):
+    """Icon update section; records are stored column-wise"""
+    return {
+        'updated': 0,
+        'task_names': deque(maxlen=maxlen),
+        'old_icons': deque(maxlen=maxlen),
+        'new_icons': deque(maxlen=maxlen),
+        'timestamps': deque(maxlen=maxlen)
+    }
+
+
+def _new_errors_section(maxlen=None):
+    """Error section; errors are always kept in full"""
+    return []
+
+
+def _section_counters(section):
+    """A summary section without its record history (errors become a count)"""
+    if isinstance(section, list):
+        return len(section)
+    return {key: value for key, value in section.items() if not isinstance(value, deque)}
+
+
+def _json_default(obj):
+    """JSON fallback for the report: deques as lists, anything else as str"""
+    if isinstance(obj, deque):
+        return list(obj)
+    return str(obj)
 
 
 class SyncReporter:
     """Enhanced reporting for sync operations with detailed tables and step-by-step logging"""
     
-    def __init__(self):
+    __slots__ = (
+        'sync_start_time', 'sync_data', 'verbosity', 'muted_statuses', '_history_maxlen',
+        '_ts_cached_sec', '_ts_cached_str', '_jsonl_file', '_jsonl_enc'
+    )
+    
+    # Actions with their own counter in the one-way sections
+    _DIRECTION_COUNTERS = frozenset(('created', 'updated', 'failed'))
+    
+    # Bidirectional comparison -> counter key (anything else counts as no_change)
+    _COMPARISON_COUNTERS = {
+        'notion_newer': 'notion_newer',
+        'gtasks_newer': 'gtasks_newer',
+        'conflict': 'conflicts'
+    }
+    
+    # Verbosity levels, read from the SYNC_VERBOSITY environment variable
+    V_QUIET = 0
+    V_NORMAL = 1
+    V_VERBOSE = 2
+    
+    # Substep statuses hidden below each level (warnings and errors always print)
+    _MUTED_BELOW = {
+        V_QUIET: frozenset(('info', 'processing', 'success')),
+        V_NORMAL: frozenset(('info',)),
+    }
+    
+    # Factories for the summary sections, created on first use
+    _DEFAULT_SECTIONS = {
+        'notion_to_gtasks': _new_direction_section,
+        'gtasks_to_notion': _new_direction_section,
+        'bidirectional': _new_bidirectional_section,
+        'categories': _new_categories_section,
+        'icons': _new_icons_section,
+        'errors': _new_errors_section
+    }
+    
+    def __init__(self, unbounded: bool = False):
         self.sync_start_time = None
+        # Keep every record instead of the last HISTORY_LIMIT per section
+        self._history_maxlen = None if unbounded else HISTORY_LIMIT
+        self.set_verbosity(self._env_verbosity())
+        self._ts_cached_sec = -1
+        self._ts_cached_str = ''
+        self._jsonl_file = None
+        self._jsonl_enc = None
         self.sync_data = {
             'timestamp': None,
             'duration': None,
             'steps': [],
-            'summary': {
-                'notion_to_gtasks': {
-                    'created': 0,
-                    'updated': 0,
-                    'failed': 0,
-                    'tasks': []
-                },
-                'gtasks_to_notion': {
-                    'created': 0,
-                    'updated': 0,
-                    'failed': 0,
-                    'tasks': []
-                },
-                'bidirectional': {
-                    'notion_newer': 0,
-                    'gtasks_newer': 0,
-                    'conflicts': 0,
-                    'no_change': 0,
-                    'tasks': []
-                },
-                'categories': {
-                    'synced': 0,
-                    'created_notion': 0,
-                    'created_gtasks': 0,
-                    'mappings': {}
-                },
-                'icons': {
-                    'updated': 0,
-                    'tasks': []
-                },
-                'errors': []
-            }
+            # Sections are created on first record, see _section()
+            'summary': {}
         }
     
+    def _section(self, name):
+        """Get a summary section for recording, creating it on first use"""
+        summary = self.sync_data['summary']
+        section = summary.get(name)
+        if section is None:
+            section = summary.setdefault(name, self._DEFAULT_SECTIONS[name](self._history_maxlen))
+        return section
+    
+    def open_jsonl(self, path: str):
+        """Append every record to a JSON Lines log as it happens"""
+        try:
+            self._jsonl_file = open(path, 'a', buffering=1)
+            self._jsonl_enc = json.JSONEncoder(default=str).encode
+        except Exception as e:
+            print(f"❌ Failed to open sync log {path}: {e}")
+    
+    def close_jsonl(self):
+        """Close the JSON Lines log"""
+        if self._jsonl_file is not None:
+            self._jsonl_file.close()
+            self._jsonl_file = None
+    
+    def _log_record(self, section_name, record):
+        """Write one record to the JSON Lines log"""
+        self._jsonl_file.write(self._jsonl_enc({'section': section_name, **record}) + '\n')
+    
+    def _now_hms(self):
+        """Current local time as HH:MM:SS, formatted at most once per second"""
+        now = int(time.time())
+        if now != self._ts_cached_sec:
+            lt = time.localtime(now)
+            self._ts_cached_sec = now
+            self._ts_cached_str = f'{lt.tm_hour:02}:{lt.tm_min:02}:{lt.tm_sec:02}'
+        return self._ts_cached_str
+    
+    def _write(self, lines):
+        """Write a block of lines with a single stdout write"""
+        sys.stdout.write('\n'.join(lines) + '\n')
+    
     def start_sync(self):
         """Mark the start of sync operation"""
         self.sync_start_time = datetime.now()
         self.sync_data['timestamp'] = self.sync_start_time.strftime('%Y-%m-%d %H:%M:%S')
         
-        print("╔" + "═" * 78 + "╗")
-        print("║" + " " * 20 + "🚀 ENHANCED GTASKS-NOTION SYNC STARTED" + " " * 18 + "║")
-        print("║" + f" Started at: {self.sync_data['timestamp']}" + " " * (78 - 12 - len(self.sync_data['timestamp'])) + "║")
-        print("╚" + "═" * 78 + "╝")
-        print()
+        lines = []
+        lines.append(_TOP_BORDER)
+        lines.append(_START_TITLE_LINE)
+        lines.append("║" + f" Started at: {self.sync_data['timestamp']}" + " " * (78 - 12 - len(self.sync_data['timestamp'])) + "║")
+        lines.append(_BOTTOM_BORDER)
+        lines.append("")
+        
+        self._write(lines)
     
     def log_step(self, step_number: int, title: str, description: str = ""):
         """Log a sync step with enhanced formatting"""
@@ -66,116 +228,140 @@ class SyncReporter:
             'number': step_number,
             'title': title,
             'description': description,
-            'timestamp': datetime.now().strftime('%H:%M:%S')
+            'timestamp': self._now_hms()
         }
         self.sync_data['steps'].append(step_info)
         
-        print(f"┌─ Step {step_number}: {title}")
+        lines = []
+        lines.append(f"┌─ Step {step_number}: {title}")
         if description:
-            print(f"│  {description}")
-        print(f"│  ⏰ {step_info['timestamp']}")
-        print("└" + "─" * 50)
-        print()
+            lines.append(f"│  {description}")
+        lines.append(f"│  ⏰ {step_info['timestamp']}")
+        lines.append("└" + _DASH50)
+        lines.append("")
+        
+        self._write(lines)
+    
+    def _env_verbosity(self):
+        """Verbosity from SYNC_VERBOSITY, or V_NORMAL when unset or not a number"""
+        try:
+            return int(os.environ.get('SYNC_VERBOSITY', self.V_NORMAL))
+        except ValueError:
+            return self.V_NORMAL
+    
+    def set_verbosity(self, level: int):
+        """Set the verbosity level (clamped to V_QUIET..V_VERBOSE); info substeps only print at V_VERBOSE"""
+        level = min(max(level, self.V_QUIET), self.V_VERBOSE)
+        self.verbosity = level
+        self.muted_statuses = set(self._MUTED_BELOW.get(level, ()))
+    
+    def is_enabled(self, status: str) -> bool:
+        """Check whether substeps with this status are printed"""
+        return status not in self.muted_statuses
     
     def log_substep(self, action: str, details: str = "", status: str = "info"):
         """Log a substep with status indicators"""
-        status_icons = {
-            'info': 'ℹ️',
-            'success': '✅',
-            'warning': '⚠️',
-            'error': '❌',
-            'processing': '🔄'
-        }
+        if status in self.muted_statuses:
+            return
         
-        icon = status_icons.get(status, 'ℹ️')
-        print(f"  {icon}  {action}")
+        icon = _STATUS_ICONS.get(status, _DEFAULT_STATUS_ICON)
+        lines = []
+        lines.append(f"  {icon}  {action}")
         if details:
-            print(f"      └─ {details}")
+            lines.append(f"      └─ {details}")
+        
+        self._write(lines)
     
     def log_batch_operation(self, operation_type: str, count: int, duration: float = None):
         """Log batch operation details"""
+        lines = []
         duration_text = f" ({duration:.1f}s)" if duration else ""
-        print(f"  🚀  Batch {operation_type}: {count} items{duration_text}")
+        lines.append(f"  🚀  Batch {operation_type}: {count} items{duration_text}")
         
         if count > 0:
             batch_size = 3 if operation_type.startswith('Notion') else count
             batches = (count + batch_size - 1) // batch_size
             if batches > 1:
-                print(f"      └─ Processing in {batches} batches of {batch_size} items each")
+                lines.append(f"      └─ Processing in {batches} batches of {batch_size} items each")
+        
+        self._write(lines)
     
     def record_notion_to_gtasks(self, action: str, task_name: str, details: Dict[str, Any]):
         """Record Notion to GTasks sync action"""
-        record = {
-            'action': action,
-            'task_name': task_name,
-            'details': details,
-            'timestamp': datetime.now().strftime('%H:%M:%S')
-        }
+        section = self._section('notion_to_gtasks')
+        timestamp = self._now_hms()
         
-        if action == 'created':
-            self.sync_data['summary']['notion_to_gtasks']['created'] += 1
-        elif action == 'updated':
-            self.sync_data['summary']['notion_to_gtasks']['updated'] += 1
-        elif action == 'failed':
-            self.sync_data['summary']['notion_to_gtasks']['failed'] += 1
+        # Counter keys match the action names ('created', 'updated', 'failed')
+        if action in self._DIRECTION_COUNTERS:
+            section[action] += 1
         
-        self.sync_data['summary']['notion_to_gtasks']['tasks'].append(record)
+        section['actions'].append(action)
+        section['task_names'].append(task_name)
+        section['details'].append(details)
+        section['timestamps'].append(timestamp)
+        
+        if self._jsonl_file is not None:
+            self._log_record('notion_to_gtasks', {'action': action, 'task_name': task_name,
+                                             'details': details, 'timestamp': timestamp})
     
     def record_gtasks_to_notion(self, action: str, task_name: str, details: Dict[str, Any]):
         """Record GTasks to Notion sync action"""
-        record = {
-            'action': action,
-            'task_name': task_name,
-            'details': details,
-            'timestamp': datetime.now().strftime('%H:%M:%S')
-        }
+        section = self._section('gtasks_to_notion')
+        timestamp = self._now_hms()
         
-        if action == 'created':
-            self.sync_data['summary']['gtasks_to_notion']['created'] += 1
-        elif action == 'updated':
-            self.sync_data['summary']['gtasks_to_notion']['updated'] += 1
-        elif action == 'failed':
-            self.sync_data['summary']['gtasks_to_notion']['failed'] += 1
+        # Counter keys match the action names ('created', 'updated', 'failed')
+        if action in self._DIRECTION_COUNTERS:
+            section[action] += 1
         
-        self.sync_data['summary']['gtasks_to_notion']['tasks'].append(record)
+        section['actions'].append(action)
+        section['task_names'].append(task_name)
+        section['details'].append(details)
+        section['timestamps'].append(timestamp)
+        
+        if self._jsonl_file is not None:
+            self._log_record('gtasks_to_notion', {'action': action, 'task_name': task_name,
+                                             'details': details, 'timestamp': timestamp})
     
     def record_bidirectional_sync(self, action: str, task_name: str, comparison: str, changes: List[str]):
         """Record bidirectional sync action"""
-        record = {
-            'action': action,
-            'task_name': task_name,
-            'comparison': comparison,
-            'changes': changes,
-            'timestamp': datetime.now().strftime('%H:%M:%S')
-        }
+        section = self._section('bidirectional')
+        timestamp = self._now_hms()
         
-        if comparison == 'notion_newer':
-            self.sync_data['summary']['bidirectional']['notion_newer'] += 1
-        elif comparison == 'gtasks_newer':
-            self.sync_data['summary']['bidirectional']['gtasks_newer'] += 1
-        elif comparison == 'conflict':
-            self.sync_data['summary']['bidirectional']['conflicts'] += 1
-        else:
-            self.sync_data['summary']['bidirectional']['no_change'] += 1
+        section[self._COMPARISON_COUNTERS.get(comparison, 'no_change')] += 1
         
-        self.sync_data['summary']['bidirectional']['tasks'].append(record)
+        section['actions'].append(action)
+        section['task_names'].append(task_name)
+        section['comparisons'].append(comparison)
+        section['changes'].append(changes)
+        section['timestamps'].append(timestamp)
+        
+        if self._jsonl_file is not None:
+            self._log_record('bidirectional', {'action': action, 'task_name': task_name, 'comparison': comparison,
+                                               'changes': changes, 'timestamp': timestamp})
     
     def record_category_sync(self, category_mappings: Dict[str, str]):
         """Record category synchronization results"""
-        self.sync_data['summary']['categories']['mappings'] = category_mappings
-        self.sync_data['summary']['categories']['synced'] = len(category_mappings)
+        # Snapshot, so later changes to the caller's dict don't alter the report
+        mappings = dict(category_mappings)
+        section = self._section('categories')
+        section['mappings'] = mappings
+        section['synced'] = len(mappings)
     
     def record_icon_update(self, task_name: str, old_icon: str, new_icon: str):
         """Record icon update"""
-        record = {
-            'task_name': task_name,
-            'old_icon': old_icon or 'none',
-            'new_icon': new_icon,
-            'timestamp': datetime.now().strftime('%H:%M:%S')
-        }
+        section = self._section('icons')
+        timestamp = self._now_hms()
+        old_icon = old_icon or 'none'
         
-        self.sync_data['summary']['icons']['updated'] += 1
-        self.sync_data['summary']['icons']['tasks'].append(record)
+        section['updated'] += 1
+        section['task_names'].append(task_name)
+        section['old_icons'].append(old_icon)
+        section['new_icons'].append(new_icon)
+        section['timestamps'].append(timestamp)
+        
+        if self._jsonl_file is not None:
+            self._log_record('icons', {'task_name': task_name, 'old_icon': old_icon,
+                                       'new_icon': new_icon, 'timestamp': timestamp})
     
     def record_error(self, error_type: str, message: str, details: Dict[str, Any] = None):
         """Record error information"""
@@ -183,150 +369,197 @@ class SyncReporter:
             'type': error_type,
             'message': message,
             'details': details or {},
-            'timestamp': datetime.now().strftime('%H:%M:%S')
+            'timestamp': self._now_hms()
         }
         
-        self.sync_data['summary']['errors'].append(error_record)
+        self._section('errors').append(error_record)
+        
+        if self._jsonl_file is not None:
+            self._log_record('errors', error_record)
     
     def end_sync(self, success: bool = True):
         """Complete sync and show comprehensive summary"""
         end_time = datetime.now()
-        duration = end_time - self.sync_start_time
-        self.sync_data['duration'] = duration.total_seconds()
+        duration_s = (end_time - self.sync_start_time).total_seconds()
+        self.sync_data['duration'] = duration_s
+        summary = self.sync_data['summary']
         
-        print("\n")
-        print("╔" + "═" * 78 + "╗")
-        print("║" + " " * 25 + "📊 SYNC COMPLETION SUMMARY" + " " * 25 + "║")
-        print("╚" + "═" * 78 + "╝")
+        lines = []
+        lines.append("\n")
+        lines.append(_TOP_BORDER)
+        lines.append(_SUMMARY_TITLE_LINE)
+        lines.append(_BOTTOM_BORDER)
         
         # Basic info
-        status = "✅ COMPLETED SUCCESSFULLY" if success else "❌ COMPLETED WITH ERRORS"
-        print(f"\n🏁 Status: {status}")
-        print(f"⏱️  Duration: {duration.total_seconds():.1f} seconds")
-        print(f"📅 Completed at: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        status = _STATUS_OK if success else _STATUS_ERR
+        lines.append(f"\n🏁 Status: {status}")
+        lines.append(f"⏱️  Duration: {duration_s:.1f} seconds")
+        lines.append(f"📅 Completed at: {end_time.strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Summary tables
-        self._print_summary_tables()
+        self._add_summary_tables(lines, summary)
         
         # Detailed breakdown
         if success:
-            self._print_detailed_breakdown()
+            self._add_detailed_breakdown(lines, summary)
         
-        print("\n" + "═" * 80)
-        print("🎉 Sync operation completed. All systems synchronized!")
-        print("═" * 80 + "\n")
+        lines.append("\n" + _EQ80)
+        lines.append("🎉 Sync operation completed. All systems synchronized!")
+        lines.append(_EQ80 + "\n")
+        
+        # The whole summary goes out in a single write
+        self._write(lines)
+        sys.stdout.flush()
     
-    def _print_summary_tables(self):
-        """Print comprehensive summary tables"""
-        print(f"\n┌─ 📋 OPERATION SUMMARY")
-        print("│")
+    def _add_summary_tables(self, lines, summary):
+        """Append comprehensive summary tables to lines"""
+        n2g = _section_or_empty(summary, 'notion_to_gtasks')
+        g2n = _section_or_empty(summary, 'gtasks_to_notion')
+        bid = _section_or_empty(summary, 'bidirectional')
+        cat = _section_or_empty(summary, 'categories')
+        icons = _section_or_empty(summary, 'icons')
+        errors = _section_or_empty(summary, 'errors')
+        
+        lines.append(f"\n┌─ 📋 OPERATION SUMMARY")
+        lines.append("│")
         
         # Notion to GTasks table
-        n2g = self.sync_data['summary']['notion_to_gtasks']
-        print("│  🔵 Notion → Google Tasks:")
-        print(f"│     Created: {n2g['created']:>3} | Updated: {n2g['updated']:>3} | Failed: {n2g['failed']:>3}")
+        lines.append("│  🔵 Notion → Google Tasks:")
+        lines.append(f"│     Created: {n2g['created']:>3} | Updated: {n2g['updated']:>3} | Failed: {n2g['failed']:>3}")
         
         # GTasks to Notion table  
-        g2n = self.sync_data['summary']['gtasks_to_notion']
-        print("│  🟢 Google Tasks → Notion:")
-        print(f"│     Created: {g2n['created']:>3} | Updated: {g2n['updated']:>3} | Failed: {g2n['failed']:>3}")
+        lines.append("│  🟢 Google Tasks → Notion:")
+        lines.append(f"│     Created: {g2n['created']:>3} | Updated: {g2n['updated']:>3} | Failed: {g2n['failed']:>3}")
         
         # Bidirectional sync table
-        bid = self.sync_data['summary']['bidirectional']
-        print("│  🔄 Bidirectional Updates:")
-        print(f"│     Notion Newer: {bid['notion_newer']:>3} | GTasks Newer: {bid['gtasks_newer']:>3}")
-        print(f"│     No Changes: {bid['no_change']:>5} | Conflicts: {bid['conflicts']:>7}")
+        lines.append("│  🔄 Bidirectional Updates:")
+        lines.append(f"│     Notion Newer: {bid['notion_newer']:>3} | GTasks Newer: {bid['gtasks_newer']:>3}")
+        lines.append(f"│     No Changes: {bid['no_change']:>5} | Conflicts: {bid['conflicts']:>7}")
         
         # Categories and icons
-        cat = self.sync_data['summary']['categories']
-        icons = self.sync_data['summary']['icons']
-        print(f"│  🗂️  Categories Synced: {cat['synced']}")
-        print(f"│  🎨 Icons Updated: {icons['updated']}")
+        lines.append(f"│  🗂️  Categories Synced: {cat['synced']}")
+        lines.append(f"│  🎨 Icons Updated: {icons['updated']}")
         
         # Errors
-        errors = len(self.sync_data['summary']['errors'])
-        print(f"│  ❌ Errors: {errors}")
-        print("└" + "─" * 50)
+        lines.append(f"│  ❌ Errors: {len(errors)}")
+        lines.append("└" + _DASH50)
     
-    def _print_detailed_breakdown(self):
-        """Print detailed breakdown of all operations"""
-        print(f"\n┌─ 📊 DETAILED BREAKDOWN")
-        print("│")
+    def _add_detailed_breakdown(self, lines, summary):
+        """Append detailed breakdown of all operations to lines"""
+        mappings = _section_or_empty(summary, 'categories')['mappings']
+        n2g = _section_or_empty(summary, 'notion_to_gtasks')
+        g2n = _section_or_empty(summary, 'gtasks_to_notion')
+        bid = _section_or_empty(summary, 'bidirectional')
+        icons = _section_or_empty(summary, 'icons')
+        errors = _section_or_empty(summary, 'errors')
+        
+        lines.append(f"\n┌─ 📊 DETAILED BREAKDOWN")
+        lines.append("│")
+        
+        # Nothing recorded: close the box without walking the empty sections
+        if not (mappings or n2g['task_names'] or g2n['task_names'] or bid['task_names']
+                or icons['task_names'] or errors):
+            lines.append("│  (no changes recorded)")
+            lines.append("└" + _DASH60)
+            return
         
         # Category mappings
-        if self.sync_data['summary']['categories']['mappings']:
-            print("│  🗂️  Category Mappings:")
-            for category, list_id in self.sync_data['summary']['categories']['mappings'].items():
-                print(f"│     '{category}' ↔ {list_id[:8]}...")
-        
-        # Recent changes
-        all_tasks = []
-        
-        # Collect all task operations
-        for task in self.sync_data['summary']['notion_to_gtasks']['tasks']:
-            all_tasks.append({
-                'type': f"Notion→GTasks ({task['action']})",
-                'name': task['task_name'],
-                'time': task['timestamp'],
-                'details': task.get('details', {})
-            })
-        
-        for task in self.sync_data['summary']['gtasks_to_notion']['tasks']:
-            all_tasks.append({
-                'type': f"GTasks→Notion ({task['action']})",
-                'name': task['task_name'], 
-                'time': task['timestamp'],
-                'details': task.get('details', {})
-            })
-        
-        for task in self.sync_data['summary']['bidirectional']['tasks']:
-            direction = "Notion→GTasks" if task['comparison'] == 'notion_newer' else "GTasks→Notion"
-            all_tasks.append({
-                'type': f"Bidirectional ({direction})",
-                'name': task['task_name'],
-                'time': task['timestamp'],
-                'details': {'changes': task['changes']}
-            })
+        if mappings:
+            lines.append("│  🗂️  Category Mappings:")
+            for category, list_id in mappings.items():
+                lines.append(f"│     '{category}' ↔ {list_id[:8]}...")
+        
+        # Recent changes as (time, type, name, changes) rows
+        total = len(n2g['task_names']) + len(g2n['task_names']) + len(bid['task_names'])
         
         # Show recent task changes
-        if all_tasks:
-            print("│")
-            print("│  📝 Task Operations:")
-            for task in sorted(all_tasks, key=lambda x: x['time'])[-10:]:  # Last 10 operations
-                print(f"│     {task['time']} | {task['type']:<20} | {task['name'][:30]}")
-                if task['details'].get('changes'):
-                    for change in task['details']['changes'][:2]:  # First 2 changes
-                        print(f"│                      └─ {change}")
+        if total:
+            # Top 10 by time with a 10-item heap; ties keep the later row, as a stable sort would
+            n2g_rows = ((timestamp, _N2G_TYPE.get(action) or f"Notion→GTasks ({action})", name, (details or {}).get('changes'))
+                        for action, name, details, timestamp in zip(n2g['actions'], n2g['task_names'], n2g['details'], n2g['timestamps']))
+            g2n_rows = ((timestamp, _G2N_TYPE.get(action) or f"GTasks→Notion ({action})", name, (details or {}).get('changes'))
+                        for action, name, details, timestamp in zip(g2n['actions'], g2n['task_names'], g2n['details'], g2n['timestamps']))
+            bid_rows = ((timestamp, _BID_N2G_TYPE if comparison == 'notion_newer' else _BID_G2N_TYPE, name, changes)
+                        for comparison, name, changes, timestamp in zip(bid['comparisons'], bid['task_names'], bid['changes'], bid['timestamps']))
+            recent = heapq.nlargest(10, enumerate(chain(n2g_rows, g2n_rows, bid_rows)),
+                                    key=lambda row: (row[1][0], row[0]))  # Last 10 operations
+            
+            lines.append("│")
+            lines.append("│  📝 Task Operations:")
+            for _, (timestamp, task_type, name, changes) in reversed(recent):
+                lines.append(f"│     {timestamp} | {task_type:<20} | {name[:30]}")
+                if changes:
+                    for change in changes[:2]:  # First 2 changes
+                        lines.append(f"│                      └─ {change}")
         
         # Icon updates
-        if self.sync_data['summary']['icons']['tasks']:
-            print("│")
-            print("│  🎨 Icon Updates:")
-            for icon_update in self.sync_data['summary']['icons']['tasks'][-5:]:  # Last 5
-                print(f"│     {icon_update['time']} | {icon_update['task_name'][:30]} | {icon_update['old_icon']} → {icon_update['new_icon']}")
+        if icons['task_names']:
+            lines.append("│")
+            lines.append("│  🎨 Icon Updates:")
+            start = max(0, len(icons['task_names']) - 5)  # Last 5
+            recent_icons = islice(zip(icons['timestamps'], icons['task_names'],
+                                      icons['old_icons'], icons['new_icons']), start, None)
+            for timestamp, name, old_icon, new_icon in recent_icons:
+                lines.append(f"│     {timestamp} | {name[:30]} | {old_icon} → {new_icon}")
         
         # Errors
-        if self.sync_data['summary']['errors']:
-            print("│")
-            print("│  ❌ Errors:")
-            for error in self.sync_data['summary']['errors']:
-                print(f"│     {error['time']} | {error['type']}: {error['message']}")
+        if errors:
+            lines.append("│")
+            lines.append("│  ❌ Errors:")
+            for error in errors:
+                lines.append(f"│     {error['timestamp']} | {error['type']}: {error['message']}")
         
-        print("└" + "─" * 60)
+        lines.append("└" + _DASH60)
     
     def get_sync_data(self):
         """Get complete sync data for external use"""
         return self.sync_data
     
-    def save_sync_report(self, file_path: str):
-        """Save detailed sync report to file"""
+    def save_sync_report(self, file_path: str, compact: bool = False):
+        """Save detailed sync report to file (compact drops the indentation)
+        
+        With a JSON Lines log open the records are already on disk, so only
+        the counters are saved.
+        """
         try:
+            report = self.sync_data
+            if self._jsonl_file is not None:
+                report = dict(report, summary={
+                    name: _section_counters(section)
+                    for name, section in report['summary'].items()
+                })
+            
+            if compact:
+                encoder = json.JSONEncoder(separators=(',', ':'), default=_json_default)
+            else:
+                encoder = json.JSONEncoder(indent=2, default=_json_default)
+            
+            # Stream encoded chunks so the whole report is never built as one string
             with open(file_path, 'w') as f:
-                json.dump(self.sync_data, f, indent=2, default=str)
+                f.writelines(encoder.iterencode(report))
             print(f"📄 Detailed sync report saved to: {file_path}")
         except Exception as e:
             print(f"❌ Failed to save sync report: {e}")
 
 
-# Global reporter instance
-sync_reporter = SyncReporter()
\ No newline at end of file
+# Read-only stand-ins for sections that were never recorded
+_EMPTY_SECTIONS = {name: factory() for name, factory in SyncReporter._DEFAULT_SECTIONS.items()}
+
+
+def _section_or_empty(summary, name):
+    """Get a summary section for reading; unrecorded sections are shared empties"""
+    return summary.get(name, _EMPTY_SECTIONS[name])
+
+
+# Global reporter instance, created on first access
+_sync_reporter = None
+
+
+def __getattr__(name):
+    """Create the shared sync_reporter lazily (PEP 562)"""
+    global _sync_reporter
+    if name == 'sync_reporter':
+        if _sync_reporter is None:
+            _sync_reporter = SyncReporter()
+        return _sync_reporter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file